@@ -5,96 +5,138 @@ Test script to populate the database with sample data for demonstration.
 
 import sys
 from pathlib import Path
-from datetime import datetime
 
 # Add src directory to path
 sys.path.insert(0, str(Path(__file__).parent / "src"))
 
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+from slack_emoji_tracker.config import config
 from slack_emoji_tracker.database import get_db_session
 from slack_emoji_tracker.service import EmojiService
 
 
-def create_sample_data():
-    """Create sample data for testing the emoji tracker."""
-    print("🔄 Creating sample data...")
+def seed_sample_data(db: Session) -> int:
+    """Load the sample users, channels and emoji usage into a session.
+
+    Safe to run repeatedly: users and channels are upserted. Returns the
+    number of emoji usage events inserted.
+    """
+    service = EmojiService(db, None)  # No Slack API needed for sample data
     
-    with get_db_session() as db:
-        service = EmojiService(db, None)  # No Slack API needed for sample data
-        
-        # Create some sample users
-        print("👥 Creating sample users...")
-        users = [
-            ("U1234567890", "alice@example.com", "Alice", "Alice Johnson"),
-            ("U1234567891", "bob@example.com", "Bob", "Bob Smith"),
-            ("U1234567892", "charlie@example.com", "Charlie", "Charlie Brown"),
-            ("U1234567893", "diana@example.com", "Diana", "Diana Prince"),
-            ("U1234567894", "eve@example.com", "Eve", "Eve Wilson"),
-        ]
-        
-        for slack_id, email, display_name, real_name in users:
-            service.create_or_update_user(
-                slack_id=slack_id,
-                email=email,
-                display_name=display_name,
-                real_name=real_name,
-            )
-        
-        # Create sample channels
-        print("📢 Creating sample channels...")
-        channels = [
-            ("C1234567890", "general", False),
-            ("C1234567891", "random", False),
-            ("C1234567892", "dev-team", True),
-            ("C1234567893", "announcements", False),
-        ]
-        
-        for slack_id, name, is_private in channels:
-            service.create_or_update_channel(
-                slack_id=slack_id,
-                name=name,
-                is_private=is_private,
-            )
-        
-        # Create sample emoji usage
-        print("😀 Creating sample emoji usage...")
-        
+    # This is a throwaway bulk load, so skip waiting on the WAL flush
+    if db.get_bind().dialect.name == "postgresql":
+        db.execute(text("SET LOCAL synchronous_commit = OFF"))
+    
+    # Create some sample users
+    users = [
+        ("U1234567890", "alice@example.com", "Alice", "Alice Johnson"),
+        ("U1234567891", "bob@example.com", "Bob", "Bob Smith"),
+        ("U1234567892", "charlie@example.com", "Charlie", "Charlie Brown"),
+        ("U1234567893", "diana@example.com", "Diana", "Diana Prince"),
+        ("U1234567894", "eve@example.com", "Eve", "Eve Wilson"),
+    ]
+    
+    user_rows = [
+        {
+            "slack_id": slack_id,
+            "email": email,
+            "display_name": display_name,
+            "real_name": real_name,
+            "is_bot": False,
+        }
+        for slack_id, email, display_name, real_name in users
+    ]
+    user_ids = service.bulk_upsert_users(user_rows)
+    
+    # Create sample channels
+    channels = [
+        ("C1234567890", "general", False),
+        ("C1234567891", "random", False),
+        ("C1234567892", "dev-team", True),
+        ("C1234567893", "announcements", False),
+    ]
+    
+    channel_rows = [
+        {
+            "slack_id": slack_id,
+            "name": name,
+            "is_private": is_private,
+            "is_archived": False,
+        }
+        for slack_id, name, is_private in channels
+    ]
+    channel_ids = service.bulk_upsert_channels(channel_rows)
+    
+    # Create sample emoji usage
+    usage = [
         # Alice gives reactions
-        service.track_emoji_usage("U1234567890", "thumbsup", "reaction", "C1234567890", "1609459200.123", "Great work on the project!", "U1234567891")
-        service.track_emoji_usage("U1234567890", "heart", "reaction", "C1234567890", "1609459201.123", "Thanks for the help!", "U1234567891")
-        service.track_emoji_usage("U1234567890", "fire", "reaction", "C1234567891", "1609459202.123", "Amazing presentation today", "U1234567892")
-        service.track_emoji_usage("U1234567890", "rocket", "reaction", "C1234567891", "1609459203.123", "Let's ship this feature", "U1234567893")
-        service.track_emoji_usage("U1234567890", "trophy", "reaction", "C1234567892", "1609459204.123", "Congratulations on the win!", "U1234567894")
+        ("U1234567890", "thumbsup", "reaction", "C1234567890", "1609459200.123", "Great work on the project!", "U1234567891"),
+        ("U1234567890", "heart", "reaction", "C1234567890", "1609459201.123", "Thanks for the help!", "U1234567891"),
+        ("U1234567890", "fire", "reaction", "C1234567891", "1609459202.123", "Amazing presentation today", "U1234567892"),
+        ("U1234567890", "rocket", "reaction", "C1234567891", "1609459203.123", "Let's ship this feature", "U1234567893"),
+        ("U1234567890", "trophy", "reaction", "C1234567892", "1609459204.123", "Congratulations on the win!", "U1234567894"),
         
         # Bob gives reactions
-        service.track_emoji_usage("U1234567891", "thumbsup", "reaction", "C1234567890", "1609459205.123", "Nice code review feedback", "U1234567890")
-        service.track_emoji_usage("U1234567891", "heart", "reaction", "C1234567890", "1609459206.123", "Love the new design", "U1234567892")
-        service.track_emoji_usage("U1234567891", "fire", "reaction", "C1234567891", "1609459207.123", "Hot fix deployed successfully", "U1234567893")
-        service.track_emoji_usage("U1234567891", "star", "reaction", "C1234567891", "1609459208.123", "Outstanding performance", "U1234567894")
+        ("U1234567891", "thumbsup", "reaction", "C1234567890", "1609459205.123", "Nice code review feedback", "U1234567890"),
+        ("U1234567891", "heart", "reaction", "C1234567890", "1609459206.123", "Love the new design", "U1234567892"),
+        ("U1234567891", "fire", "reaction", "C1234567891", "1609459207.123", "Hot fix deployed successfully", "U1234567893"),
+        ("U1234567891", "star", "reaction", "C1234567891", "1609459208.123", "Outstanding performance", "U1234567894"),
         
         # Charlie gives reactions
-        service.track_emoji_usage("U1234567892", "heart", "reaction", "C1234567890", "1609459209.123", "Thanks for mentoring me", "U1234567890")
-        service.track_emoji_usage("U1234567892", "clap", "reaction", "C1234567890", "1609459210.123", "Great job on the demo", "U1234567891")
-        service.track_emoji_usage("U1234567892", "100", "reaction", "C1234567891", "1609459211.123", "Perfect solution!", "U1234567893")
-        service.track_emoji_usage("U1234567892", "muscle", "reaction", "C1234567891", "1609459212.123", "Strong work ethic", "U1234567894")
+        ("U1234567892", "heart", "reaction", "C1234567890", "1609459209.123", "Thanks for mentoring me", "U1234567890"),
+        ("U1234567892", "clap", "reaction", "C1234567890", "1609459210.123", "Great job on the demo", "U1234567891"),
+        ("U1234567892", "100", "reaction", "C1234567891", "1609459211.123", "Perfect solution!", "U1234567893"),
+        ("U1234567892", "muscle", "reaction", "C1234567891", "1609459212.123", "Strong work ethic", "U1234567894"),
         
         # Diana uses emojis in messages
-        service.track_emoji_usage("U1234567893", "brain", "message", "C1234567892", "1609459213.123", "Big brain energy today! :brain:")
-        service.track_emoji_usage("U1234567893", "fire", "message", "C1234567892", "1609459214.123", "This feature is :fire:")
-        service.track_emoji_usage("U1234567893", "rocket", "message", "C1234567893", "1609459215.123", "Ready to :rocket: this to production")
+        ("U1234567893", "brain", "message", "C1234567892", "1609459213.123", "Big brain energy today! :brain:", None),
+        ("U1234567893", "fire", "message", "C1234567892", "1609459214.123", "This feature is :fire:", None),
+        ("U1234567893", "rocket", "message", "C1234567893", "1609459215.123", "Ready to :rocket: this to production", None),
         
         # Eve gives more reactions to create interesting leaderboard data
-        service.track_emoji_usage("U1234567894", "trophy", "reaction", "C1234567890", "1609459216.123", "Achievement unlocked!", "U1234567890")
-        service.track_emoji_usage("U1234567894", "trophy", "reaction", "C1234567890", "1609459217.123", "Winner winner!", "U1234567891")
-        service.track_emoji_usage("U1234567894", "rocket", "reaction", "C1234567891", "1609459218.123", "To the moon!", "U1234567892")
-        service.track_emoji_usage("U1234567894", "fire", "reaction", "C1234567891", "1609459219.123", "Burning through tasks", "U1234567893")
-        service.track_emoji_usage("U1234567894", "heart", "reaction", "C1234567892", "1609459220.123", "Much appreciated", "U1234567890")
+        ("U1234567894", "trophy", "reaction", "C1234567890", "1609459216.123", "Achievement unlocked!", "U1234567890"),
+        ("U1234567894", "trophy", "reaction", "C1234567890", "1609459217.123", "Winner winner!", "U1234567891"),
+        ("U1234567894", "rocket", "reaction", "C1234567891", "1609459218.123", "To the moon!", "U1234567892"),
+        ("U1234567894", "fire", "reaction", "C1234567891", "1609459219.123", "Burning through tasks", "U1234567893"),
+        ("U1234567894", "heart", "reaction", "C1234567892", "1609459220.123", "Much appreciated", "U1234567890"),
+    ]
+    
+    usage_rows = []
+    for user_id, emoji, usage_type, channel_id, message_ts, message_text, target_id in usage:
+        # Skip emojis that are not configured for tracking
+        score = config.get_emoji_score(emoji)
+        if score == 0:
+            continue
+        usage_rows.append(
+            {
+                "user_id": user_ids[user_id],
+                "channel_id": channel_ids[channel_id],
+                "emoji_name": emoji,
+                "emoji_score": score,
+                "usage_type": usage_type,
+                "message_ts": message_ts,
+                "message_text": message_text,
+                "target_user_id": user_ids[target_id] if target_id else None,
+            }
+        )
+    return service.bulk_track_emoji_usage(usage_rows)
+
+
+def create_sample_data():
+    """Create sample data for testing the emoji tracker."""
+    print("🔄 Creating sample data...")
+    
+    with get_db_session() as db:
+        usage_count = seed_sample_data(db)
         
         print("✅ Sample data created successfully!")
         print()
         print("📊 Summary:")
         print("- 5 users created")
         print("- 4 channels created")
-        print("- 17 emoji usage events created")
+        print(f"- {usage_count} emoji usage events created")
         print()
         print("🎉 You can now test the API endpoints with real data!")
 
@@ -0,0 +1,31 @@
+"""Add covering indexes for channel stats and drop the emoji_name index
+
+Revision ID: 2b7e0f94d1c8
+Revises: a6c9e2d45f13
+Create Date: 2026-10-15 11:38:51.027463
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '2b7e0f94d1c8'
+down_revision = 'a6c9e2d45f13'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Global stats read emoji_stats now, so nothing filters usage by emoji_name alone
+    op.drop_index('ix_emoji_usage_emoji_name', table_name='emoji_usage')
+    op.drop_index('ix_emoji_usage_channel_emoji', table_name='emoji_usage')
+    op.create_index('ix_emoji_usage_channel_emoji', 'emoji_usage', ['channel_id', 'emoji_name'], unique=False, postgresql_include=['count', 'emoji_score'])
+    op.create_index('ix_emoji_usage_channel_user', 'emoji_usage', ['channel_id', 'user_id'], unique=False, postgresql_include=['count', 'emoji_score'])
+
+
+def downgrade() -> None:
+    op.drop_index('ix_emoji_usage_channel_user', table_name='emoji_usage')
+    op.drop_index('ix_emoji_usage_channel_emoji', table_name='emoji_usage')
+    op.create_index('ix_emoji_usage_channel_emoji', 'emoji_usage', ['channel_id', 'emoji_name'], unique=False)
+    op.create_index('ix_emoji_usage_emoji_name', 'emoji_usage', ['emoji_name'], unique=False)
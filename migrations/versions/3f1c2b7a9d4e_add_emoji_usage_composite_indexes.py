@@ -0,0 +1,28 @@
+"""Add composite indexes to emoji_usage
+
+Revision ID: 3f1c2b7a9d4e
+Revises: 608ceca06edd
+Create Date: 2026-10-15 09:12:04.118273
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '3f1c2b7a9d4e'
+down_revision = '608ceca06edd'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index('ix_emoji_usage_channel_emoji', 'emoji_usage', ['channel_id', 'emoji_name'], unique=False)
+    op.create_index('ix_emoji_usage_user_created', 'emoji_usage', ['user_id', 'created_at'], unique=False)
+    op.create_index('ix_emoji_usage_target_created', 'emoji_usage', ['target_user_id', 'created_at'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_emoji_usage_target_created', table_name='emoji_usage')
+    op.drop_index('ix_emoji_usage_user_created', table_name='emoji_usage')
+    op.drop_index('ix_emoji_usage_channel_emoji', table_name='emoji_usage')
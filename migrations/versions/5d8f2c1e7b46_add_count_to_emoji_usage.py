@@ -0,0 +1,24 @@
+"""Add count to emoji_usage
+
+Revision ID: 5d8f2c1e7b46
+Revises: e81d3a9c6f20
+Create Date: 2026-10-15 10:52:39.615084
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '5d8f2c1e7b46'
+down_revision = 'e81d3a9c6f20'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column('emoji_usage', sa.Column('count', sa.Integer(), server_default='1', nullable=False))
+
+
+def downgrade() -> None:
+    op.drop_column('emoji_usage', 'count')
@@ -0,0 +1,50 @@
+"""Add denormalized emoji totals to users
+
+Revision ID: 7c3a5e19d2f4
+Revises: 2b7e0f94d1c8
+Create Date: 2026-10-15 12:04:17.382915
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '7c3a5e19d2f4'
+down_revision = '2b7e0f94d1c8'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column('users', sa.Column('total_given_count', sa.Integer(), server_default='0', nullable=False))
+    op.add_column('users', sa.Column('total_given_score', sa.Integer(), server_default='0', nullable=False))
+    op.add_column('users', sa.Column('total_received_count', sa.Integer(), server_default='0', nullable=False))
+    op.add_column('users', sa.Column('total_received_score', sa.Integer(), server_default='0', nullable=False))
+    
+    # Backfill the totals from the existing aggregated stats
+    op.execute(
+        """
+        UPDATE users SET
+            total_given_count = COALESCE((SELECT SUM(given_count) FROM emoji_stats WHERE emoji_stats.user_id = users.id), 0),
+            total_given_score = COALESCE((SELECT SUM(given_score) FROM emoji_stats WHERE emoji_stats.user_id = users.id), 0),
+            total_received_count = COALESCE((SELECT SUM(received_count) FROM emoji_stats WHERE emoji_stats.user_id = users.id), 0),
+            total_received_score = COALESCE((SELECT SUM(received_score) FROM emoji_stats WHERE emoji_stats.user_id = users.id), 0)
+        """
+    )
+    
+    op.create_index('ix_users_total_given_count', 'users', [sa.text('total_given_count DESC')], unique=False)
+    op.create_index('ix_users_total_given_score', 'users', [sa.text('total_given_score DESC')], unique=False)
+    op.create_index('ix_users_total_received_count', 'users', [sa.text('total_received_count DESC')], unique=False)
+    op.create_index('ix_users_total_received_score', 'users', [sa.text('total_received_score DESC')], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_users_total_received_score', table_name='users')
+    op.drop_index('ix_users_total_received_count', table_name='users')
+    op.drop_index('ix_users_total_given_score', table_name='users')
+    op.drop_index('ix_users_total_given_count', table_name='users')
+    op.drop_column('users', 'total_received_score')
+    op.drop_column('users', 'total_received_count')
+    op.drop_column('users', 'total_given_score')
+    op.drop_column('users', 'total_given_count')
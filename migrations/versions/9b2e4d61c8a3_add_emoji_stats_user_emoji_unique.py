@@ -0,0 +1,48 @@
+"""Add unique constraint on emoji_stats user_id and emoji_name
+
+Revision ID: 9b2e4d61c8a3
+Revises: 3f1c2b7a9d4e
+Create Date: 2026-10-15 09:41:27.530912
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '9b2e4d61c8a3'
+down_revision = '3f1c2b7a9d4e'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Fold any duplicate (user_id, emoji_name) rows into the oldest one first
+    op.execute("""
+        UPDATE emoji_stats SET
+            given_count = (SELECT SUM(s.given_count) FROM emoji_stats s
+                           WHERE s.user_id = emoji_stats.user_id AND s.emoji_name = emoji_stats.emoji_name),
+            given_score = (SELECT SUM(s.given_score) FROM emoji_stats s
+                           WHERE s.user_id = emoji_stats.user_id AND s.emoji_name = emoji_stats.emoji_name),
+            received_count = (SELECT SUM(s.received_count) FROM emoji_stats s
+                              WHERE s.user_id = emoji_stats.user_id AND s.emoji_name = emoji_stats.emoji_name),
+            received_score = (SELECT SUM(s.received_score) FROM emoji_stats s
+                              WHERE s.user_id = emoji_stats.user_id AND s.emoji_name = emoji_stats.emoji_name),
+            first_used = (SELECT MIN(s.first_used) FROM emoji_stats s
+                          WHERE s.user_id = emoji_stats.user_id AND s.emoji_name = emoji_stats.emoji_name),
+            last_used = (SELECT MAX(s.last_used) FROM emoji_stats s
+                         WHERE s.user_id = emoji_stats.user_id AND s.emoji_name = emoji_stats.emoji_name)
+        WHERE id IN (
+            SELECT MIN(id) FROM emoji_stats GROUP BY user_id, emoji_name HAVING COUNT(*) > 1
+        )
+    """)
+    op.execute("""
+        DELETE FROM emoji_stats WHERE id NOT IN (
+            SELECT MIN(id) FROM emoji_stats GROUP BY user_id, emoji_name
+        )
+    """)
+    op.create_unique_constraint('uq_emoji_stats_user_emoji', 'emoji_stats', ['user_id', 'emoji_name'])
+
+
+def downgrade() -> None:
+    op.drop_constraint('uq_emoji_stats_user_emoji', 'emoji_stats', type_='unique')
@@ -0,0 +1,26 @@
+"""Add id to the emoji_usage user history index
+
+Revision ID: a6c9e2d45f13
+Revises: 5d8f2c1e7b46
+Create Date: 2026-10-15 11:14:05.382716
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'a6c9e2d45f13'
+down_revision = '5d8f2c1e7b46'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.drop_index('ix_emoji_usage_user_created', table_name='emoji_usage')
+    op.create_index('ix_emoji_usage_user_created', 'emoji_usage', ['user_id', 'created_at', 'id'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_emoji_usage_user_created', table_name='emoji_usage')
+    op.create_index('ix_emoji_usage_user_created', 'emoji_usage', ['user_id', 'created_at'], unique=False)
@@ -0,0 +1,26 @@
+"""Add per-user score indexes to emoji_stats
+
+Revision ID: c47a0e5f2b19
+Revises: 9b2e4d61c8a3
+Create Date: 2026-10-15 10:05:48.204617
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'c47a0e5f2b19'
+down_revision = '9b2e4d61c8a3'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index('ix_emoji_stats_user_given_score', 'emoji_stats', ['user_id', sa.text('given_score DESC')], unique=False)
+    op.create_index('ix_emoji_stats_user_received_score', 'emoji_stats', ['user_id', sa.text('received_score DESC')], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_emoji_stats_user_received_score', table_name='emoji_stats')
+    op.drop_index('ix_emoji_stats_user_given_score', table_name='emoji_stats')
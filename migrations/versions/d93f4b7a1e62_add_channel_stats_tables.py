@@ -0,0 +1,73 @@
+"""Add per-channel emoji and user stats tables
+
+Revision ID: d93f4b7a1e62
+Revises: 7c3a5e19d2f4
+Create Date: 2026-10-15 12:41:09.615204
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'd93f4b7a1e62'
+down_revision = '7c3a5e19d2f4'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table('channel_emoji_stats',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('channel_id', sa.Integer(), nullable=False),
+    sa.Column('emoji_name', sa.String(length=100), nullable=False),
+    sa.Column('count', sa.Integer(), nullable=False),
+    sa.Column('score', sa.Integer(), nullable=False),
+    sa.Column('updated_at', sa.DateTime(), nullable=True),
+    sa.ForeignKeyConstraint(['channel_id'], ['channels.id'], ),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('channel_id', 'emoji_name', name='uq_channel_emoji_stats_channel_emoji'),
+    sqlite_autoincrement=True
+    )
+    op.create_table('channel_user_stats',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('channel_id', sa.Integer(), nullable=False),
+    sa.Column('user_id', sa.Integer(), nullable=False),
+    sa.Column('count', sa.Integer(), nullable=False),
+    sa.Column('score', sa.Integer(), nullable=False),
+    sa.Column('updated_at', sa.DateTime(), nullable=True),
+    sa.ForeignKeyConstraint(['channel_id'], ['channels.id'], ),
+    sa.ForeignKeyConstraint(['user_id'], ['users.id'], ),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('channel_id', 'user_id', name='uq_channel_user_stats_channel_user'),
+    sqlite_autoincrement=True
+    )
+    op.create_index('ix_channel_user_stats_channel_score', 'channel_user_stats', ['channel_id', sa.text('score DESC')], unique=False)
+    
+    # Backfill from the usage log
+    op.execute("""
+        INSERT INTO channel_emoji_stats (channel_id, emoji_name, count, score, updated_at)
+        SELECT channel_id, emoji_name, SUM(count), COALESCE(SUM(emoji_score), 0), CURRENT_TIMESTAMP
+        FROM emoji_usage
+        WHERE channel_id IS NOT NULL
+        GROUP BY channel_id, emoji_name
+    """)
+    op.execute("""
+        INSERT INTO channel_user_stats (channel_id, user_id, count, score, updated_at)
+        SELECT channel_id, user_id, SUM(count), COALESCE(SUM(emoji_score), 0), CURRENT_TIMESTAMP
+        FROM emoji_usage
+        WHERE channel_id IS NOT NULL
+        GROUP BY channel_id, user_id
+    """)
+    
+    # Channel stats no longer aggregate emoji_usage, so its channel indexes only cost writes
+    op.drop_index('ix_emoji_usage_channel_user', table_name='emoji_usage')
+    op.drop_index('ix_emoji_usage_channel_emoji', table_name='emoji_usage')
+
+
+def downgrade() -> None:
+    op.create_index('ix_emoji_usage_channel_emoji', 'emoji_usage', ['channel_id', 'emoji_name'], unique=False, postgresql_include=['count', 'emoji_score'])
+    op.create_index('ix_emoji_usage_channel_user', 'emoji_usage', ['channel_id', 'user_id'], unique=False, postgresql_include=['count', 'emoji_score'])
+    op.drop_index('ix_channel_user_stats_channel_score', table_name='channel_user_stats')
+    op.drop_table('channel_user_stats')
+    op.drop_table('channel_emoji_stats')
@@ -0,0 +1,34 @@
+"""Drop redundant single-column indexes
+
+Revision ID: e81d3a9c6f20
+Revises: c47a0e5f2b19
+Create Date: 2026-10-15 10:31:12.947360
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'e81d3a9c6f20'
+down_revision = 'c47a0e5f2b19'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Primary keys are already indexed, and created_at is only read through
+    # the (user_id, created_at) / (target_user_id, created_at) indexes
+    op.drop_index('ix_emoji_usage_created_at', table_name='emoji_usage')
+    op.drop_index('ix_emoji_stats_id', table_name='emoji_stats')
+    op.drop_index('ix_emoji_usage_id', table_name='emoji_usage')
+    op.drop_index('ix_channels_id', table_name='channels')
+    op.drop_index('ix_users_id', table_name='users')
+
+
+def downgrade() -> None:
+    op.create_index('ix_users_id', 'users', ['id'], unique=False)
+    op.create_index('ix_channels_id', 'channels', ['id'], unique=False)
+    op.create_index('ix_emoji_usage_id', 'emoji_usage', ['id'], unique=False)
+    op.create_index('ix_emoji_stats_id', 'emoji_stats', ['id'], unique=False)
+    op.create_index('ix_emoji_usage_created_at', 'emoji_usage', ['created_at'], unique=False)
@@ -0,0 +1,250 @@
+"""
+Command-line entry point for the Slack Emoji Tracker application.
+
+Run with ``python -m slack_emoji_tracker <mode>`` or the ``emoji-tracker``
+script installed by Poetry.
+
+This script provides multiple run modes:
+- api: Start the REST API server
+- slack: Start the Slack event listener
+- setup-db: Initialize the database and run migrations
+- rebuild-stats: Recompute aggregated emoji statistics from usage history
+- test: Test all connections and configurations
+"""
+
+import argparse
+import asyncio
+import logging
+import sys
+
+from slack_emoji_tracker.config import config
+
+# Database, Slack and web server modules are imported inside the run modes that
+# need them, so each subcommand only pays for its own import graph.
+
+
+def setup_logging() -> None:
+    """Set up logging configuration."""
+    logging.basicConfig(
+        level=getattr(logging, config.log_level),
+        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+    )
+
+
+def run_api() -> None:
+    """Start the FastAPI REST API server.
+
+    Uvicorn manages its own event loop, so this runs outside asyncio.run().
+    Development uses a single auto-reloading worker; other environments run
+    several workers on uvloop and httptools without access logging.
+    """
+    import uvicorn
+    
+    development = config.environment == "development"
+    
+    print("🚀 Starting Slack Emoji Tracker API...")
+    print(f"📡 Server will be available at http://{config.api_host}:{config.api_port}")
+    print(f"📚 API documentation at http://{config.api_host}:{config.api_port}/docs")
+    
+    uvicorn.run(
+        "slack_emoji_tracker.api:app",
+        host=config.api_host,
+        port=config.api_port,
+        reload=development,
+        workers=1 if development else config.api_workers,
+        loop="asyncio" if development else "uvloop",
+        http="httptools",
+        access_log=development,
+        log_level=config.log_level.lower(),
+    )
+
+
+async def run_slack_listener() -> None:
+    """Start the Slack event listener."""
+    # The listener sizes its connection pool separately from the API workers
+    config.db_pool_size = config.slack_db_pool_size
+    config.db_max_overflow = config.slack_db_max_overflow
+    
+    from slack_emoji_tracker.slack_service import SlackService
+    
+    print("🔄 Starting Slack event listener...")
+    
+    try:
+        slack_service = SlackService()
+        await slack_service.start()
+        
+        print("✅ Slack listener started successfully")
+        print("📡 Listening for emoji events...")
+        print("Press Ctrl+C to stop")
+        
+        # Keep the listener running; on Ctrl+C asyncio.run cancels this
+        # coroutine instead of raising KeyboardInterrupt here, so shut down
+        # in finally to close the socket and cancel in-flight event tasks
+        try:
+            while True:
+                await asyncio.sleep(1)
+        finally:
+            print("\n🛑 Stopping Slack listener...")
+            await slack_service.stop()
+            print("✅ Slack listener stopped")
+            
+    except Exception as e:
+        print(f"❌ Failed to start Slack listener: {e}")
+        sys.exit(1)
+
+
+async def setup_database() -> None:
+    """Initialize the database and run migrations."""
+    from slack_emoji_tracker.database import check_database_connection, create_tables
+    
+    print("🗄️  Setting up database...")
+    
+    # Check database connection
+    if not check_database_connection():
+        print("❌ Database connection failed!")
+        print("Make sure PostgreSQL is running and DATABASE_URL is correct")
+        sys.exit(1)
+    
+    print("✅ Database connection successful")
+    
+    # Create tables
+    try:
+        create_tables()
+        print("✅ Database tables created successfully")
+    except Exception as e:
+        print(f"❌ Failed to create database tables: {e}")
+        sys.exit(1)
+    
+    # Try to sync some initial data if Slack is configured
+    try:
+        from slack_emoji_tracker.slack_service import SlackService
+        
+        config.validate_required_config()
+        slack_service = SlackService()
+        
+        print("👥 Syncing users from Slack...")
+        user_count = await slack_service.sync_users(limit=100)
+        print(f"✅ Synced {user_count} users")
+        
+        print("📢 Syncing channels from Slack...")
+        channel_count = await slack_service.sync_channels(limit=100)
+        print(f"✅ Synced {channel_count} channels")
+        
+    except Exception as e:
+        print(f"⚠️  Could not sync Slack data: {e}")
+        print("Database setup complete, but Slack sync failed")
+        print("Make sure SLACK_BOT_TOKEN and SLACK_APP_TOKEN are configured")
+
+
+def rebuild_stats() -> None:
+    """Recompute aggregated emoji statistics from the usage history."""
+    from slack_emoji_tracker.database import get_db_session
+    from slack_emoji_tracker.service import EmojiService
+    
+    print("📊 Rebuilding emoji statistics...")
+    
+    try:
+        with get_db_session() as db:
+            row_count = EmojiService(db).rebuild_emoji_stats()
+        print(f"✅ Rebuilt {row_count} emoji stats rows")
+    except Exception as e:
+        print(f"❌ Failed to rebuild emoji statistics: {e}")
+        sys.exit(1)
+
+
+async def test_connections() -> None:
+    """Test all connections and configurations."""
+    from slack_emoji_tracker.database import check_database_connection
+    
+    print("🧪 Testing connections and configuration...")
+    
+    # Test database connection
+    print("\n🗄️  Testing database connection...")
+    if check_database_connection():
+        print("✅ Database connection successful")
+    else:
+        print("❌ Database connection failed")
+        return
+    
+    # Test emoji configuration
+    print("\n😀 Testing emoji configuration...")
+    try:
+        emoji_count = len(config.emoji_config["emojis"])
+        default_score = config.emoji_config["settings"]["default_score"]
+        print(f"✅ Emoji config loaded: {emoji_count} emojis, default score: {default_score}")
+        
+        # Test a few emojis
+        test_emojis = ["thumbsup", "heart", "nonexistent"]
+        for emoji in test_emojis:
+            score = config.get_emoji_score(emoji)
+            print(f"   {emoji}: score={score}")
+            
+    except Exception as e:
+        print(f"❌ Emoji configuration error: {e}")
+        return
+    
+    # Test Slack connection
+    print("\n📱 Testing Slack connection...")
+    try:
+        from slack_emoji_tracker.slack_service import SlackService
+        
+        config.validate_required_config()
+        slack_service = SlackService()
+        
+        if await slack_service.test_connection():
+            print("✅ Slack connection successful")
+        else:
+            print("❌ Slack connection failed")
+            
+    except Exception as e:
+        print(f"❌ Slack configuration error: {e}")
+        print("Make sure SLACK_BOT_TOKEN and SLACK_APP_TOKEN are set in .env")
+    
+    print("\n🎉 Connection tests completed!")
+
+
+def main() -> None:
+    """Main entry point."""
+    parser = argparse.ArgumentParser(
+        description="Slack Emoji Tracker - Multi-mode application"
+    )
+    parser.add_argument(
+        "mode",
+        choices=["api", "slack", "setup-db", "rebuild-stats", "test"],
+        help=(
+            "Run mode: api (REST API), slack (event listener), setup-db (database setup), "
+            "rebuild-stats (recompute statistics), test (connection tests)"
+        ),
+    )
+    
+    args = parser.parse_args()
+    
+    # Set up logging
+    setup_logging()
+    
+    print("🎯 Slack Emoji Tracker")
+    print(f"🔧 Environment: {config.environment}")
+    print(f"📊 Log level: {config.log_level}")
+    print()
+    
+    # Run the appropriate mode
+    try:
+        if args.mode == "api":
+            run_api()
+        elif args.mode == "slack":
+            asyncio.run(run_slack_listener())
+        elif args.mode == "setup-db":
+            asyncio.run(setup_database())
+        elif args.mode == "rebuild-stats":
+            rebuild_stats()
+        elif args.mode == "test":
+            asyncio.run(test_connections())
+    except KeyboardInterrupt:
+        print("\n👋 Goodbye!")
+    except Exception as e:
+        print(f"\n❌ Error: {e}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
@@ -1,15 +1,24 @@
 """FastAPI application for the Slack Emoji Tracker REST API."""
 
+import asyncio
+import hashlib
 import logging
-from datetime import datetime
-from typing import List, Optional
+import time
+from datetime import datetime, timezone
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple
 
-from fastapi import Depends, FastAPI, HTTPException, Query
+import orjson
+from fastapi import Depends, FastAPI, HTTPException, Query, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse, ORJSONResponse
+from slack_sdk import WebClient
+from sqlalchemy import func, lambda_stmt, select
 from sqlalchemy.orm import Session
 
 from .config import config
 from .database import check_database_connection, get_db
+from .models import Channel, EmojiStats, User
 from .schemas import (
     ChannelStats,
     EmojiConfigResponse,
@@ -17,11 +26,11 @@ from .schemas import (
     HealthStatus,
     LeaderboardEntry,
     LeaderboardResponse,
+    LeaderboardSort,
     UserHistoryResponse,
     UserStats,
 )
-from .service import EmojiService
-from .slack_service import SlackService
+from .service import LEADERBOARD_CACHE_TTL_SECONDS, EmojiService
 
 logger = logging.getLogger(__name__)
 
@@ -32,25 +41,57 @@ app = FastAPI(
     version="0.1.0",
     docs_url="/docs",
     redoc_url="/redoc",
+    default_response_class=ORJSONResponse,
 )
 
-# Add CORS middleware
+# How long browsers may cache a preflight response
+CORS_MAX_AGE_SECONDS = 86400
+
+# Add CORS middleware; the API is read-only, so only GET needs to be allowed.
+# Credentials are never combined with a wildcard origin, since Starlette would
+# then echo back any origin that asks.
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"],  # Configure this properly for production
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    allow_origins=config.cors_origins,
+    allow_credentials="*" not in config.cors_origins,
+    allow_methods=("GET",),
+    allow_headers=("Authorization", "Content-Type"),
+    max_age=CORS_MAX_AGE_SECONDS,
 )
 
-# Global Slack service instance (optional, for health checks)
-slack_service: Optional[SlackService] = None
+# Global Slack Web API client (optional, for health checks and user lookups)
+slack_client: Optional[WebClient] = None
+
+# How long a Slack connection check result is reused by /health
+SLACK_HEALTH_TTL_SECONDS = 10.0
+
+# (monotonic timestamp, result) of the last Slack connection check
+_slack_health_cache = (0.0, False)
+
+# HTTP cache lifetimes for the configuration and workspace-wide stats
+EMOJI_CONFIG_MAX_AGE_SECONDS = 60
+GLOBAL_STATS_CACHE_TTL_SECONDS = 60
+
+# (monotonic timestamp, payload, etag) of the last /stats/global computation
+_global_stats_cache: Tuple[float, Optional[Dict[str, Any]], str] = (0.0, None, "")
+
+
+def _compute_etag(payload: Any) -> str:
+    """Derive a strong ETag from a JSON-serializable payload."""
+    return '"%s"' % hashlib.sha1(orjson.dumps(payload)).hexdigest()
+
+
+def _not_modified(request: Request, response: Response, etag: str, max_age: int) -> bool:
+    """Set caching headers and report whether the client's copy is current."""
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = f"public, max-age={max_age}"
+    return request.headers.get("if-none-match") == etag
 
 
 @app.on_event("startup")
 async def startup_event():
     """Initialize services on startup."""
-    global slack_service
+    global slack_client
     
     # Set up logging
     logging.basicConfig(
@@ -60,12 +101,36 @@ async def startup_event():
     
     logger.info("Starting Slack Emoji Tracker API...")
     
-    # Optionally initialize Slack service for health checks
+    # Build the OpenAPI schema now instead of on the first /openapi.json hit
+    app.openapi()
+    
+    # Optionally initialize a Slack Web API client; the API never needs the
+    # Socket Mode client and its background threads
     try:
-        if config.slack_bot_token and config.slack_app_token:
-            slack_service = SlackService()
+        if config.slack_bot_token:
+            slack_client = WebClient(token=config.slack_bot_token)
     except Exception as e:
-        logger.warning(f"Could not initialize Slack service: {e}")
+        logger.warning(f"Could not initialize Slack client: {e}")
+
+
+def _check_slack_connection() -> Optional[bool]:
+    """Test the Slack connection, reusing a recent result."""
+    global _slack_health_cache
+    if not slack_client:
+        return None
+    
+    checked_at, slack_healthy = _slack_health_cache
+    if time.monotonic() - checked_at < SLACK_HEALTH_TTL_SECONDS:
+        return slack_healthy
+    
+    try:
+        slack_client.auth_test()
+        slack_healthy = True
+    except Exception as e:
+        logger.error(f"Slack health check failed: {e}")
+        slack_healthy = False
+    _slack_health_cache = (time.monotonic(), slack_healthy)
+    return slack_healthy
 
 
 @app.get("/health", response_model=HealthStatus)
@@ -73,36 +138,34 @@ async def health_check():
     """
     Get system health status including database and Slack connection status.
     """
-    # Check database connection
-    db_healthy = check_database_connection()
-    
-    # Check Slack connection if available
-    slack_healthy = None
-    if slack_service:
-        try:
-            slack_healthy = await slack_service.test_connection()
-        except Exception as e:
-            logger.error(f"Slack health check failed: {e}")
-            slack_healthy = False
+    # Both probes block, so run them side by side in worker threads
+    db_healthy, slack_healthy = await asyncio.gather(
+        asyncio.to_thread(check_database_connection),
+        asyncio.to_thread(_check_slack_connection),
+    )
     
     status = "healthy" if db_healthy else "unhealthy"
     if slack_healthy is False:
         status = "degraded"
     
-    return HealthStatus(
-        status=status,
-        database=db_healthy,
-        slack=slack_healthy,
-        timestamp=datetime.utcnow().isoformat(),
-    )
+    return {
+        "status": status,
+        "database": db_healthy,
+        "slack": slack_healthy,
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+    }
+
+
+def get_emoji_service(db: Session = Depends(get_db)) -> EmojiService:
+    """Dependency providing an EmojiService bound to the request's session."""
+    return EmojiService(db, slack_client)
 
 
 @app.get("/users/{slack_id}/stats", response_model=UserStats)
-async def get_user_stats(slack_id: str, db: Session = Depends(get_db)):
+def get_user_stats(slack_id: str, emoji_service: EmojiService = Depends(get_emoji_service)):
     """
     Get comprehensive statistics for a specific user including totals and top emojis given/received.
     """
-    emoji_service = EmojiService(db, slack_service.web_client if slack_service else None)
     stats = emoji_service.get_user_stats(slack_id)
     
     if not stats:
@@ -112,39 +175,52 @@ async def get_user_stats(slack_id: str, db: Session = Depends(get_db)):
 
 
 @app.get("/leaderboard", response_model=LeaderboardResponse)
-async def get_leaderboard(
-    sort_by: str = Query(
-        "received_score",
+def get_leaderboard(
+    response: Response,
+    sort_by: LeaderboardSort = Query(
+        LeaderboardSort.received_score,
         description="Sort field: received_score, received_count, given_score, given_count",
     ),
     limit: int = Query(50, ge=1, le=200, description="Number of entries to return"),
-    db: Session = Depends(get_db),
+    emoji_service: EmojiService = Depends(get_emoji_service),
 ):
     """
     Get leaderboard data sorted by various metrics (received/given score/count).
     """
-    emoji_service = EmojiService(db, slack_service.web_client if slack_service else None)
     entries = emoji_service.get_leaderboard(sort_by=sort_by, limit=limit)
+    response.headers["Cache-Control"] = f"max-age={LEADERBOARD_CACHE_TTL_SECONDS}"
     
-    return LeaderboardResponse(
-        entries=entries,
-        sort_by=sort_by,
-        total_users=len(entries),
-    )
+    # Returned as a dict: response_model validates it once, whereas a model
+    # instance would be validated, dumped and validated again by FastAPI
+    return {
+        "entries": entries,
+        "sort_by": sort_by.value,
+        "total_users": len(entries),
+    }
 
 
 @app.get("/users/{slack_id}/history", response_model=UserHistoryResponse)
-async def get_user_history(
+def get_user_history(
     slack_id: str,
     limit: int = Query(100, ge=1, le=500, description="Number of entries to return"),
     offset: int = Query(0, ge=0, description="Number of entries to skip"),
-    db: Session = Depends(get_db),
+    cursor: Optional[str] = Query(
+        None, description="Cursor from pagination.next_cursor; takes precedence over offset"
+    ),
+    include_total: bool = Query(
+        False, description="Count the user's entries even when not on the first page"
+    ),
+    emoji_service: EmojiService = Depends(get_emoji_service),
 ):
     """
     Get recent emoji usage history for a specific user with pagination.
     """
-    emoji_service = EmojiService(db, slack_service.web_client if slack_service else None)
-    history = emoji_service.get_user_history(slack_id, limit=limit, offset=offset)
+    try:
+        history = emoji_service.get_user_history(
+            slack_id, limit=limit, offset=offset, cursor=cursor, include_total=include_total
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     
     if not history:
         raise HTTPException(status_code=404, detail="User not found")
@@ -152,26 +228,37 @@ async def get_user_history(
     return history
 
 
-@app.get("/emojis", response_model=EmojiConfigResponse)
-async def get_emoji_config():
-    """
-    Get the current emoji configuration including scores and settings.
-    """
-    return EmojiConfigResponse(
+@lru_cache(maxsize=1)
+def _build_emoji_config_response(version: int) -> Tuple[EmojiConfigResponse, str]:
+    """Build the /emojis payload and its ETag once per emoji configuration version."""
+    payload = EmojiConfigResponse(
         emojis={
             name: {"score": emoji["score"], "description": emoji["description"]}
             for name, emoji in config.emoji_config["emojis"].items()
         },
         settings=config.emoji_config["settings"],
     )
+    return payload, _compute_etag(payload.model_dump())
+
+
+@app.get("/emojis", response_model=EmojiConfigResponse)
+async def get_emoji_config(request: Request, response: Response):
+    """
+    Get the current emoji configuration including scores and settings.
+    """
+    payload, etag = _build_emoji_config_response(config.emoji_config_version)
+    if _not_modified(request, response, etag, EMOJI_CONFIG_MAX_AGE_SECONDS):
+        return Response(status_code=304, headers=dict(response.headers))
+    return payload
 
 
 @app.get("/channels/{channel_id}/stats", response_model=ChannelStats)
-async def get_channel_stats(channel_id: str, db: Session = Depends(get_db)):
+def get_channel_stats(
+    channel_id: str, emoji_service: EmojiService = Depends(get_emoji_service)
+):
     """
     Get emoji statistics for a specific channel including totals, top emojis, and top users.
     """
-    emoji_service = EmojiService(db, slack_service.web_client if slack_service else None)
     stats = emoji_service.get_channel_stats(channel_id)
     
     if not stats:
@@ -180,24 +267,58 @@ async def get_channel_stats(channel_id: str, db: Session = Depends(get_db)):
     return stats
 
 
+# Select only the listed columns; full ORM instances are never needed here.
+# Built as a lambda statement so its SQL is compiled once and reused.
+_USER_LIST_STMT = lambda_stmt(
+    lambda: select(
+        User.id,
+        User.slack_id,
+        User.display_name,
+        User.real_name,
+        User.email,
+        User.is_bot,
+    )
+    .where(User.is_active == True)
+    .order_by(User.id)
+)
+
+
 @app.get("/users", response_model=List[dict])
-async def list_users(
+def list_users(
+    response: Response,
     limit: int = Query(100, ge=1, le=500, description="Number of users to return"),
     offset: int = Query(0, ge=0, description="Number of users to skip"),
+    cursor: Optional[int] = Query(
+        None, description="Cursor from the X-Next-Cursor header; takes precedence over offset"
+    ),
+    include_total: bool = Query(
+        False, description="Return the number of users in the X-Total-Count header"
+    ),
     db: Session = Depends(get_db),
 ):
     """
     Get a list of all users in the system with basic information.
+    
+    The count behind X-Total-Count is only run when ``include_total`` is set.
     """
-    from .models import User
-    
-    users = (
-        db.query(User)
-        .filter(User.is_active == True)
-        .offset(offset)
-        .limit(limit)
-        .all()
-    )
+    
+    # Only the paging criteria vary per request; they are bound as parameters
+    # on top of the cached base statement
+    if cursor is not None:
+        query = _USER_LIST_STMT + (lambda stmt: stmt.where(User.id > cursor))
+    else:
+        query = _USER_LIST_STMT + (lambda stmt: stmt.offset(offset))
+    
+    # Fetch one extra row to know whether another page follows
+    fetch_count = limit + 1
+    users = db.execute(query + (lambda stmt: stmt.limit(fetch_count))).all()
+    if len(users) > limit:
+        users = users[:limit]
+        response.headers["X-Next-Cursor"] = str(users[-1].id)
+    
+    if include_total:
+        total = db.execute(select(func.count(User.id)).where(User.is_active == True)).scalar()
+        response.headers["X-Total-Count"] = str(total)
     
     return [
         {
@@ -211,24 +332,56 @@ async def list_users(
     ]
 
 
+# Channel listing counterpart of _USER_LIST_STMT
+_CHANNEL_LIST_STMT = lambda_stmt(
+    lambda: select(
+        Channel.id,
+        Channel.slack_id,
+        Channel.name,
+        Channel.is_private,
+        Channel.is_archived,
+    )
+    .where(Channel.is_archived == False)
+    .order_by(Channel.id)
+)
+
+
 @app.get("/channels", response_model=List[dict])
-async def list_channels(
+def list_channels(
+    response: Response,
     limit: int = Query(100, ge=1, le=500, description="Number of channels to return"),
     offset: int = Query(0, ge=0, description="Number of channels to skip"),
+    cursor: Optional[int] = Query(
+        None, description="Cursor from the X-Next-Cursor header; takes precedence over offset"
+    ),
+    include_total: bool = Query(
+        False, description="Return the number of channels in the X-Total-Count header"
+    ),
     db: Session = Depends(get_db),
 ):
     """
     Get a list of all channels in the system with basic information.
+    
+    The count behind X-Total-Count is only run when ``include_total`` is set.
     """
-    from .models import Channel
-    
-    channels = (
-        db.query(Channel)
-        .filter(Channel.is_archived == False)
-        .offset(offset)
-        .limit(limit)
-        .all()
-    )
+    
+    # Only the paging criteria vary per request; they are bound as parameters
+    # on top of the cached base statement
+    if cursor is not None:
+        query = _CHANNEL_LIST_STMT + (lambda stmt: stmt.where(Channel.id > cursor))
+    else:
+        query = _CHANNEL_LIST_STMT + (lambda stmt: stmt.offset(offset))
+    
+    # Fetch one extra row to know whether another page follows
+    fetch_count = limit + 1
+    channels = db.execute(query + (lambda stmt: stmt.limit(fetch_count))).all()
+    if len(channels) > limit:
+        channels = channels[:limit]
+        response.headers["X-Next-Cursor"] = str(channels[-1].id)
+    
+    if include_total:
+        total = db.execute(select(func.count(Channel.id)).where(Channel.is_archived == False)).scalar()
+        response.headers["X-Total-Count"] = str(total)
     
     return [
         {
@@ -242,47 +395,69 @@ async def list_channels(
 
 
 @app.get("/stats/global", response_model=dict)
-async def get_global_stats(db: Session = Depends(get_db)):
+def get_global_stats(request: Request, response: Response, db: Session = Depends(get_db)):
     """
     Get global statistics about emoji usage across the entire workspace.
+    
+    The result is reused for ``GLOBAL_STATS_CACHE_TTL_SECONDS``; clients can
+    revalidate with If-None-Match.
     """
-    from sqlalchemy import func
-    from .models import EmojiUsage, User, Channel
-    
-    # Total usage statistics
-    total_usage = (
-        db.query(
-            func.count(EmojiUsage.id).label("total_usage"),
-            func.sum(EmojiUsage.emoji_score).label("total_score"),
-            func.count(func.distinct(EmojiUsage.emoji_name)).label("unique_emojis"),
-        )
-        .first()
-    )
+    global _global_stats_cache
     
-    # User and channel counts
-    user_count = db.query(func.count(User.id)).filter(User.is_active == True).scalar()
-    channel_count = db.query(func.count(Channel.id)).filter(Channel.is_archived == False).scalar()
+    computed_at, payload, etag = _global_stats_cache
+    if payload is None or time.monotonic() - computed_at >= GLOBAL_STATS_CACHE_TTL_SECONDS:
+        payload = _compute_global_stats(db)
+        etag = _compute_etag(payload)
+        _global_stats_cache = (time.monotonic(), payload, etag)
     
-    # Top emojis globally
-    top_emojis = (
-        db.query(
-            EmojiUsage.emoji_name,
-            func.count(EmojiUsage.id).label("count"),
-            func.sum(EmojiUsage.emoji_score).label("score"),
-        )
-        .group_by(EmojiUsage.emoji_name)
-        .order_by(func.sum(EmojiUsage.emoji_score).desc())
-        .limit(10)
-        .all()
+    if _not_modified(request, response, etag, GLOBAL_STATS_CACHE_TTL_SECONDS):
+        return Response(status_code=304, headers=dict(response.headers))
+    return payload
+
+
+def _compute_global_stats(db: Session) -> Dict[str, Any]:
+    """Aggregate workspace-wide emoji totals and the top emojis."""
+    # Per-emoji totals plus user and channel counts in a single round trip;
+    # the workspace totals and top emojis are both derived from the groups.
+    # Every usage is counted once as "given" in emoji_stats, so summing the
+    # given columns per emoji reads the pre-aggregated table instead of
+    # scanning the whole usage log.
+    user_count = (
+        select(func.count(User.id)).where(User.is_active == True).scalar_subquery()
     )
+    channel_count = (
+        select(func.count(Channel.id))
+        .where(Channel.is_archived == False)
+        .scalar_subquery()
+    )
+    emoji_totals = db.execute(
+        select(
+            EmojiStats.emoji_name,
+            func.sum(EmojiStats.given_count).label("count"),
+            func.sum(EmojiStats.given_score).label("score"),
+            user_count.label("active_users"),
+            channel_count.label("active_channels"),
+        )
+        .group_by(EmojiStats.emoji_name)
+        .having(func.sum(EmojiStats.given_count) > 0)
+    ).all()
+    
+    if emoji_totals:
+        active_users = emoji_totals[0].active_users
+        active_channels = emoji_totals[0].active_channels
+    else:
+        # No usage rows means no groups to carry the counts
+        active_users, active_channels = db.execute(select(user_count, channel_count)).one()
+    
+    top_emojis = sorted(emoji_totals, key=lambda emoji: emoji.score or 0, reverse=True)[:10]
     
     return {
         "totals": {
-            "total_usage": total_usage.total_usage or 0,
-            "total_score": total_usage.total_score or 0,
-            "unique_emojis": total_usage.unique_emojis or 0,
-            "active_users": user_count or 0,
-            "active_channels": channel_count or 0,
+            "total_usage": sum(emoji.count or 0 for emoji in emoji_totals),
+            "total_score": sum(emoji.score or 0 for emoji in emoji_totals),
+            "unique_emojis": len(emoji_totals),
+            "active_users": active_users or 0,
+            "active_channels": active_channels or 0,
         },
         "top_emojis": [
             {
@@ -299,7 +474,6 @@ async def get_global_stats(db: Session = Depends(get_db)):
 @app.exception_handler(404)
 async def not_found_handler(request, exc):
     """Handle 404 errors."""
-    from fastapi.responses import JSONResponse
     return JSONResponse(
         status_code=404,
         content={"error": "Not Found", "detail": str(exc.detail)}
@@ -309,7 +483,6 @@ async def not_found_handler(request, exc):
 @app.exception_handler(500)
 async def internal_error_handler(request, exc):
     """Handle internal server errors."""
-    from fastapi.responses import JSONResponse
     logger.error(f"Internal server error: {exc}")
     return JSONResponse(
         status_code=500,
@@ -1,10 +1,13 @@
 """Database management and connection utilities."""
 
 import logging
+import time
 from contextlib import contextmanager
+from functools import lru_cache
 from typing import Generator
 
 from sqlalchemy import create_engine, text
+from sqlalchemy.engine import Engine
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.orm import Session, sessionmaker
 
@@ -13,22 +16,52 @@ from .models import Base
 
 logger = logging.getLogger(__name__)
 
-# Create the database engine
-engine = create_engine(
-    config.database_url,
-    pool_pre_ping=True,
-    pool_recycle=300,
-    echo=config.environment == "development",
-)
+# How long a successful connection check is trusted before probing again
+HEALTH_CHECK_TTL_SECONDS = 5.0
 
-# Create session factory
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+_last_healthy_at = 0.0
+
+# Compiled SQL kept per engine; the default of 500 is tight once the ORM,
+# Core upserts and per-limit leaderboard queries are all in use
+QUERY_CACHE_SIZE = 1200
+
+
+@lru_cache(maxsize=1)
+def get_engine() -> Engine:
+    """Get the database engine, creating it on first use.
+
+    SQL echo is only ever enabled in development.
+    """
+    echo = config.environment == "development"
+    if echo:
+        logger.warning("SQL echo is enabled; every statement will be logged")
+    
+    return create_engine(
+        config.database_url,
+        pool_pre_ping=True,
+        pool_recycle=config.db_pool_recycle,
+        pool_size=config.db_pool_size,
+        max_overflow=config.db_max_overflow,
+        query_cache_size=QUERY_CACHE_SIZE,
+        echo=echo,
+    )
+
+
+@lru_cache(maxsize=1)
+def get_sessionmaker() -> sessionmaker:
+    """Get the session factory, creating it on first use.
+
+    Objects stay loaded after commit so returning them does not re-SELECT.
+    """
+    return sessionmaker(
+        autocommit=False, autoflush=False, expire_on_commit=False, bind=get_engine()
+    )
 
 
 def create_tables() -> None:
     """Create all tables in the database."""
     try:
-        Base.metadata.create_all(bind=engine)
+        Base.metadata.create_all(bind=get_engine())
         logger.info("Database tables created successfully")
     except SQLAlchemyError as e:
         logger.error(f"Error creating database tables: {e}")
@@ -36,10 +69,20 @@ def create_tables() -> None:
 
 
 def check_database_connection() -> bool:
-    """Check if the database connection is working."""
+    """Check if the database connection is working.
+
+    A successful check is cached for ``HEALTH_CHECK_TTL_SECONDS`` so frequent
+    health probes do not each cost a database round trip.
+    """
+    global _last_healthy_at
+    
+    if time.monotonic() - _last_healthy_at < HEALTH_CHECK_TTL_SECONDS:
+        return True
+    
     try:
-        with engine.connect() as connection:
+        with get_engine().connect() as connection:
             connection.execute(text("SELECT 1"))
+        _last_healthy_at = time.monotonic()
         return True
     except SQLAlchemyError as e:
         logger.error(f"Database connection failed: {e}")
@@ -49,7 +92,7 @@ def check_database_connection() -> bool:
 @contextmanager
 def get_db_session() -> Generator[Session, None, None]:
     """Get a database session with proper cleanup."""
-    session = SessionLocal()
+    session = get_sessionmaker()()
     try:
         yield session
         session.commit()
@@ -9,9 +9,11 @@ from sqlalchemy import (
     Column,
     DateTime,
     ForeignKey,
+    Index,
     Integer,
     String,
     Text,
+    UniqueConstraint,
     func,
 )
 from sqlalchemy.ext.declarative import declarative_base
@@ -25,7 +27,7 @@ class User(Base):
 
     __tablename__ = "users"
 
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True)
     slack_id = Column(String(50), unique=True, index=True, nullable=False)
     email = Column(String(255), nullable=True)
     display_name = Column(String(255), nullable=True)
@@ -34,10 +36,26 @@ class User(Base):
     is_active = Column(Boolean, default=True)
     created_at = Column(DateTime, default=func.now())
     updated_at = Column(DateTime, default=func.now(), onupdate=func.now())
+    
+    # Sums of this user's emoji_stats rows, kept in step with them so the
+    # leaderboard and user totals need no aggregation
+    total_given_count = Column(Integer, nullable=False, default=0, server_default="0")
+    total_given_score = Column(Integer, nullable=False, default=0, server_default="0")
+    total_received_count = Column(Integer, nullable=False, default=0, server_default="0")
+    total_received_score = Column(Integer, nullable=False, default=0, server_default="0")
+
+    # Relationships; lazy loads raise so queries must load what they need
+    # explicitly instead of issuing one SELECT per row
+    emoji_usage = relationship("EmojiUsage", back_populates="user", foreign_keys="EmojiUsage.user_id", lazy="raise_on_sql")
+    stats = relationship("EmojiStats", back_populates="user", lazy="raise_on_sql")
 
-    # Relationships
-    emoji_usage = relationship("EmojiUsage", back_populates="user", foreign_keys="EmojiUsage.user_id")
-    stats = relationship("EmojiStats", back_populates="user")
+    __table_args__ = (
+        # The leaderboard reads users in descending order of one of the totals
+        Index("ix_users_total_given_count", total_given_count.desc()),
+        Index("ix_users_total_given_score", total_given_score.desc()),
+        Index("ix_users_total_received_count", total_received_count.desc()),
+        Index("ix_users_total_received_score", total_received_score.desc()),
+    )
 
 
 class Channel(Base):
@@ -45,7 +63,7 @@ class Channel(Base):
 
     __tablename__ = "channels"
 
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True)
     slack_id = Column(String(50), unique=True, index=True, nullable=False)
     name = Column(String(255), nullable=True)
     is_private = Column(Boolean, default=False)
@@ -54,7 +72,7 @@ class Channel(Base):
     updated_at = Column(DateTime, default=func.now(), onupdate=func.now())
 
     # Relationships
-    emoji_usage = relationship("EmojiUsage", back_populates="channel")
+    emoji_usage = relationship("EmojiUsage", back_populates="channel", lazy="raise_on_sql")
 
 
 class EmojiUsage(Base):
@@ -62,21 +80,28 @@ class EmojiUsage(Base):
 
     __tablename__ = "emoji_usage"
 
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True)
     user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
     channel_id = Column(Integer, ForeignKey("channels.id"), nullable=True)
-    emoji_name = Column(String(100), nullable=False, index=True)
-    emoji_score = Column(Integer, default=1)
+    emoji_name = Column(String(100), nullable=False)
+    emoji_score = Column(Integer, default=1)  # Per-emoji score times count
+    count = Column(Integer, nullable=False, default=1, server_default="1")  # Occurrences in the message
     usage_type = Column(String(20), nullable=False)  # 'reaction' or 'message'
     message_ts = Column(String(50), nullable=True)  # Slack message timestamp
     message_text = Column(Text, nullable=True)  # Full message text for context
     target_user_id = Column(Integer, ForeignKey("users.id"), nullable=True)  # For reactions
-    created_at = Column(DateTime, default=func.now(), index=True)
+    created_at = Column(DateTime, default=func.now())
 
     # Relationships
-    user = relationship("User", back_populates="emoji_usage", foreign_keys=[user_id])
-    target_user = relationship("User", foreign_keys=[target_user_id])
-    channel = relationship("Channel", back_populates="emoji_usage")
+    user = relationship("User", back_populates="emoji_usage", foreign_keys=[user_id], lazy="raise_on_sql")
+    target_user = relationship("User", foreign_keys=[target_user_id], lazy="raise_on_sql")
+    channel = relationship("Channel", back_populates="emoji_usage", lazy="raise_on_sql")
+
+    __table_args__ = (
+        # User history filters on user_id and pages by (created_at, id)
+        Index("ix_emoji_usage_user_created", "user_id", "created_at", "id"),
+        Index("ix_emoji_usage_target_created", "target_user_id", "created_at"),
+    )
 
 
 class EmojiStats(Base):
@@ -84,7 +109,7 @@ class EmojiStats(Base):
 
     __tablename__ = "emoji_stats"
 
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True)
     user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
     emoji_name = Column(String(100), nullable=False)
     
@@ -102,9 +127,51 @@ class EmojiStats(Base):
     updated_at = Column(DateTime, default=func.now(), onupdate=func.now())
 
     # Relationships
-    user = relationship("User", back_populates="stats")
+    user = relationship("User", back_populates="stats", lazy="raise_on_sql")
 
     __table_args__ = (
         # Unique constraint on user_id and emoji_name
+        UniqueConstraint("user_id", "emoji_name", name="uq_emoji_stats_user_emoji"),
+        # A user's top given/received emojis are read in score order
+        Index("ix_emoji_stats_user_given_score", "user_id", given_score.desc()),
+        Index("ix_emoji_stats_user_received_score", "user_id", received_score.desc()),
+        {"sqlite_autoincrement": True},
+    )
+
+
+class ChannelEmojiStats(Base):
+    """Model for storing per-channel emoji totals."""
+
+    __tablename__ = "channel_emoji_stats"
+
+    id = Column(Integer, primary_key=True)
+    channel_id = Column(Integer, ForeignKey("channels.id"), nullable=False)
+    emoji_name = Column(String(100), nullable=False)
+    count = Column(Integer, nullable=False, default=0)
+    score = Column(Integer, nullable=False, default=0)
+    updated_at = Column(DateTime, default=func.now(), onupdate=func.now())
+
+    __table_args__ = (
+        UniqueConstraint("channel_id", "emoji_name", name="uq_channel_emoji_stats_channel_emoji"),
+        {"sqlite_autoincrement": True},
+    )
+
+
+class ChannelUserStats(Base):
+    """Model for storing per-channel totals of the emojis each user has given."""
+
+    __tablename__ = "channel_user_stats"
+
+    id = Column(Integer, primary_key=True)
+    channel_id = Column(Integer, ForeignKey("channels.id"), nullable=False)
+    user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
+    count = Column(Integer, nullable=False, default=0)
+    score = Column(Integer, nullable=False, default=0)
+    updated_at = Column(DateTime, default=func.now(), onupdate=func.now())
+
+    __table_args__ = (
+        UniqueConstraint("channel_id", "user_id", name="uq_channel_user_stats_channel_user"),
+        # Channel stats read the top users of a channel in score order
+        Index("ix_channel_user_stats_channel_score", "channel_id", score.desc()),
         {"sqlite_autoincrement": True},
-    )
\ No newline at end of file
+    )
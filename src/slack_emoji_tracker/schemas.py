@@ -1,6 +1,7 @@
 """Pydantic models for API request/response validation."""
 
 from datetime import datetime
+from enum import Enum
 from typing import Any, Dict, List, Optional
 
 from pydantic import BaseModel, Field
@@ -29,6 +30,14 @@ class UserStats(BaseModel):
     top_received: List[EmojiStats]
 
 
+class LeaderboardSort(str, Enum):
+    """Metrics the leaderboard can be sorted by."""
+    received_score = "received_score"
+    received_count = "received_count"
+    given_score = "given_score"
+    given_count = "given_count"
+
+
 class LeaderboardEntry(BaseModel):
     """Leaderboard entry model."""
     rank: int
@@ -53,10 +62,11 @@ class HistoryEntry(BaseModel):
 
 class PaginationInfo(BaseModel):
     """Pagination information."""
-    total: int
+    total: Optional[int] = None
     limit: int
     offset: int
     has_more: bool
+    next_cursor: Optional[str] = None
 
 
 class UserHistoryResponse(BaseModel):
@@ -1,19 +1,202 @@
 """Core service for emoji tracking and statistics."""
 
+import base64
 import logging
 import re
+import threading
+from collections import Counter, defaultdict
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
-from sqlalchemy import and_, desc, func
+from cachetools import LRUCache, TTLCache
+from sqlalchemy import (
+    bindparam,
+    delete,
+    desc,
+    func,
+    insert,
+    literal,
+    select,
+    tuple_,
+    union_all,
+    update,
+)
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.orm import Session
 from slack_sdk.web import WebClient
 
 from .config import config
-from .models import Channel, EmojiStats, EmojiUsage, User
+from .models import Channel, ChannelEmojiStats, ChannelUserStats, EmojiStats, EmojiUsage, User
+from .schemas import LeaderboardSort
 
 logger = logging.getLogger(__name__)
 
+# Leaderboard results are reused for a few seconds per (sort column, limit)
+LEADERBOARD_CACHE_TTL_SECONDS = 5
+
+_leaderboard_cache: TTLCache = TTLCache(maxsize=32, ttl=LEADERBOARD_CACHE_TTL_SECONDS)
+_leaderboard_cache_lock = threading.Lock()
+
+# Last result per key, kept through invalidation; served only when the
+# database fails so the leaderboard degrades to slightly old data
+LEADERBOARD_STALE_TTL_SECONDS = 3600
+
+_leaderboard_stale: TTLCache = TTLCache(maxsize=32, ttl=LEADERBOARD_STALE_TTL_SECONDS)
+
+# One lock per cache key so concurrent misses run the aggregation only once
+_leaderboard_fill_locks: Dict[Tuple[str, int], threading.Lock] = defaultdict(threading.Lock)
+
+# User total column ordered by for each leaderboard sort option
+_LEADERBOARD_SORT_COLUMNS = {
+    LeaderboardSort.received_score: User.total_received_score,
+    LeaderboardSort.received_count: User.total_received_count,
+    LeaderboardSort.given_score: User.total_given_score,
+    LeaderboardSort.given_count: User.total_given_count,
+}
+
+
+# Users whose profile was fetched from Slack recently, mapped to their primary
+# key; users in this cache are loaded by PK and not re-fetched with users.info
+# on every event
+USER_REFRESH_TTL_SECONDS = 3600
+
+_refreshed_users: TTLCache = TTLCache(maxsize=10_000, ttl=USER_REFRESH_TTL_SECONDS)
+_refreshed_users_lock = threading.Lock()
+
+# Users whose users.info lookup failed recently (unknown user, missing scope,
+# rate limit); they are stored without a profile instead of retrying on every
+# event. Guarded by _refreshed_users_lock as well
+USER_FETCH_FAILURE_TTL_SECONDS = 300
+
+_failed_user_fetches: TTLCache = TTLCache(maxsize=10_000, ttl=USER_FETCH_FAILURE_TTL_SECONDS)
+
+# Slack ID -> primary key for users and channels seen by this process, so
+# tracking an event does not look the same rows up again. Rows are never
+# deleted, so entries only fall out by LRU eviction
+PK_CACHE_SIZE = 10_000
+
+_user_pks: LRUCache = LRUCache(maxsize=PK_CACHE_SIZE)
+_channel_pks: LRUCache = LRUCache(maxsize=PK_CACHE_SIZE)
+_pk_cache_lock = threading.Lock()
+
+# Name -> user ID lookup maps built from users.list, reused across messages
+# so @name mentions do not list the whole workspace each time
+USER_LOOKUP_TTL_SECONDS = 600
+
+_user_lookup_cache: TTLCache = TTLCache(maxsize=4, ttl=USER_LOOKUP_TTL_SECONDS)
+_user_lookup_cache_lock = threading.Lock()
+
+# Lowercased @names that matched nobody in the current lookup maps; cleared
+# whenever the maps are rebuilt
+_unresolved_mentions: TTLCache = TTLCache(maxsize=1024, ttl=USER_LOOKUP_TTL_SECONDS)
+
+# Usage rows are inserted on every event; build the statement once so only
+# the parameters change between executions
+_USAGE_INSERT = insert(EmojiUsage)
+
+# Stats rows per multi-row upsert, keeping bound parameters under driver limits
+STATS_UPSERT_BATCH_SIZE = 1000
+
+# Adds per-user deltas to the denormalized totals; run with executemany
+_USER_TOTALS_UPDATE = (
+    update(User.__table__)
+    .where(User.__table__.c.id == bindparam("user_pk"))
+    .values(
+        total_given_count=User.__table__.c.total_given_count + bindparam("given_count"),
+        total_given_score=User.__table__.c.total_given_score + bindparam("given_score"),
+        total_received_count=User.__table__.c.total_received_count + bindparam("received_count"),
+        total_received_score=User.__table__.c.total_received_score + bindparam("received_score"),
+    )
+)
+
+# History rows fetched per round trip while streaming a page
+HISTORY_YIELD_PER = 200
+
+# Emojis appear in message text as :emoji_name:
+_EMOJI_PATTERN = re.compile(r":([a-zA-Z0-9_+-]+):")
+
+# Mentions appear as <@USER_ID> or <@USER_ID|name>, or typed as plain @name
+_SLACK_MENTION_PATTERN = re.compile(r"<@([A-Z0-9]+)(?:\|[^>]+)?>")
+_DISPLAY_MENTION_PATTERN = re.compile(r"@([a-zA-Z0-9._-]+)")
+
+
+def invalidate_leaderboard_cache() -> None:
+    """Drop cached leaderboard results after stats change."""
+    with _leaderboard_cache_lock:
+        _leaderboard_cache.clear()
+
+
+@lru_cache(maxsize=4096)
+def _find_emoji_names(text: str) -> Tuple[str, ...]:
+    """Find every :emoji: name in a message text, cached for repeated texts."""
+    return tuple(_EMOJI_PATTERN.findall(text))
+
+
+@lru_cache(maxsize=4096)
+def _find_slack_mentions(text: str) -> Tuple[str, ...]:
+    """Find every <@USER_ID> mention in a message text, cached for repeated texts."""
+    return tuple(_SLACK_MENTION_PATTERN.findall(text))
+
+
+def invalidate_user_lookup_cache() -> None:
+    """Drop cached users.list lookup maps so the next mention rebuilds them."""
+    with _user_lookup_cache_lock:
+        _user_lookup_cache.clear()
+        _unresolved_mentions.clear()
+
+
+def encode_history_cursor(created_at: datetime, usage_id: int) -> str:
+    """Encode the position of a history row as an opaque pagination cursor."""
+    raw = f"{created_at.isoformat()},{usage_id}".encode()
+    return base64.urlsafe_b64encode(raw).decode()
+
+
+def decode_history_cursor(cursor: str) -> Tuple[datetime, int]:
+    """Decode a history pagination cursor. Raises ValueError if it is malformed."""
+    try:
+        created_at, usage_id = base64.urlsafe_b64decode(cursor.encode()).decode().split(",")
+        return datetime.fromisoformat(created_at), int(usage_id)
+    except (TypeError, UnicodeDecodeError, ValueError) as e:
+        raise ValueError(f"Invalid history cursor: {cursor}") from e
+
+
+# Profile fields Slack may leave out of a listing (email without the
+# users:read.email scope, real_name on bots); a missing value keeps the stored one
+_USER_PROFILE_COLUMNS = ("email", "display_name", "real_name")
+_CHANNEL_PROFILE_COLUMNS = ("name",)
+
+
+def _upsert_set_columns(
+    stmt: Any, model: Any, row: Dict[str, Any], keep_existing: Tuple[str, ...]
+) -> Dict[str, Any]:
+    """Build the ON CONFLICT SET clause for a bulk upsert keyed on ``slack_id``.
+
+    Columns in ``keep_existing`` only overwrite the stored value when the new
+    one is not NULL.
+    """
+    update_columns = {}
+    for column in row:
+        if column == "slack_id":
+            continue
+        if column in keep_existing:
+            update_columns[column] = func.coalesce(
+                stmt.excluded[column], model.__table__.c[column]
+            )
+        else:
+            update_columns[column] = stmt.excluded[column]
+    update_columns["updated_at"] = func.now()
+    return update_columns
+
+
+def _dialect_insert(db: Session, model: Any) -> Any:
+    """Return an INSERT construct for the session's dialect that supports ON CONFLICT."""
+    if db.get_bind().dialect.name == "sqlite":
+        return sqlite_insert(model)
+    return pg_insert(model)
+
 
 class EmojiService:
     """Service for managing emoji tracking and statistics."""
@@ -31,32 +214,44 @@ class EmojiService:
         real_name: Optional[str] = None,
         is_bot: bool = False,
         fetch_from_slack: bool = True,
+        force_refresh: bool = False,
     ) -> User:
-        """Create a new user or update existing user information."""
-        user = self.db.query(User).filter(User.slack_id == slack_id).first()
+        """Create a new user or update existing user information.
+
+        Users fetched from Slack within the last hour are not looked up again
+        unless ``force_refresh`` is set.
+        """
+        user = None
+        
+        # Users refreshed recently are loaded by primary key and skip users.info
+        if fetch_from_slack and not force_refresh:
+            with _refreshed_users_lock:
+                user_pk = _refreshed_users.get(slack_id)
+            if user_pk is not None:
+                user = self.db.get(User, user_pk)
+            if user is not None:
+                if email is None and display_name is None and real_name is None:
+                    return user
+                fetch_from_slack = False
+        
+        if user is None:
+            user = self.db.query(User).filter(User.slack_id == slack_id).first()
         
         # Fetch user information from Slack API if available and requested
         slack_user_info = None
-        if fetch_from_slack and self.web_client:
-            try:
-                response = self.web_client.users_info(user=slack_id)
-                if response.get("ok"):
-                    slack_user_info = response.get("user", {})
-                    profile = slack_user_info.get("profile", {})
-                    
-                    # Override with Slack data if not explicitly provided
-                    if email is None:
-                        email = profile.get("email")
-                    if display_name is None:
-                        display_name = profile.get("display_name") or slack_user_info.get("name")
-                    if real_name is None:
-                        real_name = profile.get("real_name")
-                    is_bot = slack_user_info.get("is_bot", False)
-                    
-                    logger.info(f"Fetched user info from Slack for {slack_id}: {display_name}")
-                    
-            except Exception as e:
-                logger.warning(f"Failed to fetch user info from Slack for {slack_id}: {e}")
+        if fetch_from_slack:
+            slack_user_info = self._fetch_slack_user_info(slack_id, force_refresh)
+        if slack_user_info is not None:
+            profile = slack_user_info.get("profile", {})
+            
+            # Override with Slack data if not explicitly provided
+            if email is None:
+                email = profile.get("email")
+            if display_name is None:
+                display_name = profile.get("display_name") or slack_user_info.get("name")
+            if real_name is None:
+                real_name = profile.get("real_name")
+            is_bot = slack_user_info.get("is_bot", False)
         
         if user:
             # Update existing user
@@ -67,8 +262,7 @@ class EmojiService:
             if real_name is not None:
                 user.real_name = real_name
             user.is_bot = is_bot
-            user.updated_at = datetime.utcnow()
-            logger.debug(f"Updated existing user {slack_id}")
+            logger.debug("Updated existing user %s", slack_id)
         else:
             # Create new user
             user = User(
@@ -79,11 +273,60 @@ class EmojiService:
                 is_bot=is_bot,
             )
             self.db.add(user)
-            logger.info(f"Created new user {slack_id} with display_name: {display_name}")
+            logger.info("Created new user %s with display_name: %s", slack_id, display_name)
         
         self.db.flush()  # Get the ID without committing
+        
+        if slack_user_info is not None:
+            with _refreshed_users_lock:
+                _refreshed_users[slack_id] = user.id
+        
         return user
 
+    def get_user_display_name(self, slack_id: str) -> Optional[str]:
+        """Get a user's display name, creating the user only if it is unknown.
+
+        Known users are read with a single column select instead of being
+        loaded, re-fetched from Slack and rewritten.
+        """
+        row = self.db.execute(
+            select(User.display_name).where(User.slack_id == slack_id)
+        ).first()
+        if row is None:
+            return self.create_or_update_user(slack_id).display_name
+        return row.display_name
+
+    def _fetch_slack_user_info(
+        self, slack_id: str, force_refresh: bool = False
+    ) -> Optional[Dict[str, Any]]:
+        """Fetch a user's users.info payload, or None if it is unavailable.
+
+        Failed lookups are remembered for a few minutes so a user Slack will
+        not describe does not cost an API call on every event.
+        """
+        if not self.web_client:
+            return None
+        if not force_refresh:
+            with _refreshed_users_lock:
+                if slack_id in _failed_user_fetches:
+                    return None
+        
+        try:
+            response = self.web_client.users_info(user=slack_id)
+            if response.get("ok"):
+                slack_user_info = response.get("user", {})
+                logger.info("Fetched user info from Slack for %s", slack_id)
+                return slack_user_info
+            logger.warning(
+                "Slack returned no user info for %s: %s", slack_id, response.get("error")
+            )
+        except Exception as e:
+            logger.warning("Failed to fetch user info from Slack for %s: %s", slack_id, e)
+        
+        with _refreshed_users_lock:
+            _failed_user_fetches[slack_id] = True
+        return None
+
     def create_or_update_channel(
         self,
         slack_id: str,
@@ -100,7 +343,6 @@ class EmojiService:
                 channel.name = name
             channel.is_private = is_private
             channel.is_archived = is_archived
-            channel.updated_at = datetime.utcnow()
         else:
             # Create new channel
             channel = Channel(
@@ -114,6 +356,114 @@ class EmojiService:
         self.db.flush()
         return channel
 
+    def _get_pks(
+        self,
+        model: Any,
+        pk_cache: LRUCache,
+        slack_ids: List[str],
+        create: Callable[[str], Any],
+    ) -> Dict[str, int]:
+        """Map Slack IDs to primary keys of ``model``, creating unknown rows.
+
+        Keys already read from the database are served from ``pk_cache``;
+        rows created here are cached once a later lookup reads them back, so
+        a rolled back insert never leaves a dangling key behind.
+        """
+        pks: Dict[str, int] = {}
+        missing = []
+        with _pk_cache_lock:
+            for slack_id in dict.fromkeys(slack_ids):
+                pk = pk_cache.get(slack_id)
+                if pk is not None:
+                    pks[slack_id] = pk
+                else:
+                    missing.append(slack_id)
+        if not missing:
+            return pks
+        
+        found = dict(
+            self.db.execute(
+                select(model.slack_id, model.id).where(model.slack_id.in_(missing))
+            ).all()
+        )
+        with _pk_cache_lock:
+            pk_cache.update(found)
+        pks.update(found)
+        
+        for slack_id in missing:
+            if slack_id not in pks:
+                pks[slack_id] = create(slack_id).id
+        return pks
+
+    def _get_user_ids(self, slack_ids: List[str]) -> Dict[str, int]:
+        """Map Slack user IDs to primary keys, creating only the unknown users.
+
+        Known users are not re-fetched from Slack or rewritten; profile
+        changes arrive through user_change events and syncs instead.
+        """
+        return self._get_pks(User, _user_pks, slack_ids, self.create_or_update_user)
+
+    def _get_user_id(self, slack_id: str) -> int:
+        """Get a user's primary key, creating the user only if it is unknown."""
+        return self._get_user_ids([slack_id])[slack_id]
+
+    def _get_channel_ids(self, slack_ids: List[str]) -> Dict[str, int]:
+        """Map Slack channel IDs to primary keys, creating only the unknown channels."""
+        return self._get_pks(Channel, _channel_pks, slack_ids, self.create_or_update_channel)
+
+    def _get_channel_id(self, slack_id: str) -> int:
+        """Get a channel's primary key, creating the channel only if it is unknown."""
+        return self._get_channel_ids([slack_id])[slack_id]
+
+    def track_emoji_usage_bulk(self, events: List[Dict[str, Any]]) -> int:
+        """Track a burst of emoji usage events with a fixed number of queries.
+
+        Each event carries the ``track_emoji_usage`` keyword arguments. Users
+        and channels are resolved once for the whole batch, then the usage rows
+        and stats deltas are written together. Events for untracked emojis are
+        skipped. Returns the number of events tracked.
+        """
+        scored = []
+        for event in events:
+            emoji_score = config.get_emoji_score(event["emoji_name"])
+            if emoji_score == 0:
+                logger.debug("Emoji '%s' not configured for tracking", event["emoji_name"])
+                continue
+            scored.append((event, emoji_score))
+        return self._track_scored_events(scored)
+
+    def _track_scored_events(self, scored: List[Tuple[Dict[str, Any], int]]) -> int:
+        """Write usage events that already carry a non-zero emoji score."""
+        if not scored:
+            return 0
+        
+        user_slack_ids = [event["user_slack_id"] for event, _ in scored]
+        user_slack_ids.extend(
+            event["target_user_slack_id"]
+            for event, _ in scored
+            if event.get("target_user_slack_id")
+        )
+        user_ids = self._get_user_ids(user_slack_ids)
+        channel_ids = self._get_channel_ids(
+            [event["channel_slack_id"] for event, _ in scored if event.get("channel_slack_id")]
+        )
+        
+        rows = [
+            {
+                "user_id": user_ids[event["user_slack_id"]],
+                "channel_id": channel_ids.get(event.get("channel_slack_id")),
+                "emoji_name": event["emoji_name"],
+                "emoji_score": emoji_score,
+                "usage_type": event["usage_type"],
+                "message_ts": event.get("message_ts"),
+                "message_text": event.get("message_text"),
+                "target_user_id": user_ids.get(event.get("target_user_slack_id")),
+            }
+            for event, emoji_score in scored
+        ]
+        self._insert_usage_rows(rows)
+        return len(rows)
+
     def track_emoji_usage(
         self,
         user_slack_id: str,
@@ -123,131 +473,425 @@ class EmojiService:
         message_ts: Optional[str] = None,
         message_text: Optional[str] = None,
         target_user_slack_id: Optional[str] = None,
-    ) -> Optional[EmojiUsage]:
-        """Track a single emoji usage event."""
-        # Check if we should track this emoji
+    ) -> bool:
+        """Track a single emoji usage event. Returns False if the emoji is not tracked."""
         emoji_score = config.get_emoji_score(emoji_name)
         if emoji_score == 0:
-            logger.debug(f"Emoji '{emoji_name}' not configured for tracking")
-            return None
+            logger.debug("Emoji '%s' not configured for tracking", emoji_name)
+            return False
         
-        # Get or create user
-        user = self.create_or_update_user(user_slack_id)
-        
-        # Get or create channel if provided
-        channel = None
-        if channel_slack_id:
-            channel = self.create_or_update_channel(channel_slack_id)
+        # Same path as a batch; the score is looked up once and reused
+        event = {
+            "user_slack_id": user_slack_id,
+            "emoji_name": emoji_name,
+            "usage_type": usage_type,
+            "channel_slack_id": channel_slack_id,
+            "message_ts": message_ts,
+            "message_text": message_text,
+            "target_user_slack_id": target_user_slack_id,
+        }
+        self._track_scored_events([(event, emoji_score)])
         
-        # Get target user for reactions and message mentions
-        target_user = None
         if target_user_slack_id:
-            target_user = self.create_or_update_user(target_user_slack_id)
-        
-        # Create emoji usage record
-        usage = EmojiUsage(
-            user_id=user.id,
-            channel_id=channel.id if channel else None,
-            emoji_name=emoji_name,
-            emoji_score=emoji_score,
-            usage_type=usage_type,
-            message_ts=message_ts,
-            message_text=message_text,
-            target_user_id=target_user.id if target_user else None,
-        )
+            logger.info(
+                "Tracked emoji usage: %s sent %s to %s (score: %s, type: %s)",
+                user_slack_id, emoji_name, target_user_slack_id, emoji_score, usage_type,
+            )
+        else:
+            logger.info(
+                "Tracked emoji usage: %s used %s (score: %s, type: %s)",
+                user_slack_id, emoji_name, emoji_score, usage_type,
+            )
+        
+        return True
+
+    def bulk_upsert_users(self, rows: List[Dict[str, Any]]) -> Dict[str, int]:
+        """Create or update many users in a single statement.
+
+        Every row must carry the same keys, including ``slack_id``. A None
+        email, display name or real name keeps the stored value. Returns a
+        mapping of Slack user ID to database ID.
+        """
+        if not rows:
+            return {}
+        
+        rows = list({row["slack_id"]: row for row in rows}.values())
+        stmt = _dialect_insert(self.db, User).values(rows)
+        update_columns = _upsert_set_columns(stmt, User, rows[0], _USER_PROFILE_COLUMNS)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[User.slack_id], set_=update_columns
+        ).returning(User.id, User.slack_id)
+        
+        return {row.slack_id: row.id for row in self.db.execute(stmt)}
+
+    def bulk_upsert_channels(self, rows: List[Dict[str, Any]]) -> Dict[str, int]:
+        """Create or update many channels in a single statement.
+
+        Every row must carry the same keys, including ``slack_id``. A None
+        name keeps the stored value. Returns a mapping of Slack channel ID to
+        database ID.
+        """
+        if not rows:
+            return {}
         
-        self.db.add(usage)
+        rows = list({row["slack_id"]: row for row in rows}.values())
+        stmt = _dialect_insert(self.db, Channel).values(rows)
+        update_columns = _upsert_set_columns(stmt, Channel, rows[0], _CHANNEL_PROFILE_COLUMNS)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[Channel.slack_id], set_=update_columns
+        ).returning(Channel.id, Channel.slack_id)
         
-        # Update statistics
-        self._update_emoji_stats(user.id, emoji_name, emoji_score, "given")
+        return {row.slack_id: row.id for row in self.db.execute(stmt)}
+
+    def bulk_track_emoji_usage(self, rows: List[Dict[str, Any]]) -> int:
+        """Insert many emoji usage rows at once and roll them into the statistics.
+
+        Rows are plain ``emoji_usage`` column dicts that already reference user
+        and channel database IDs. Returns the number of rows inserted.
+        """
+        if not rows:
+            return 0
         
-        # Update target user stats for reactions and message mentions
-        if target_user:
-            self._update_emoji_stats(target_user.id, emoji_name, emoji_score, "received")
+        self._insert_usage_rows(rows)
         
-        if target_user_slack_id:
-            logger.info(
-                f"Tracked emoji usage: {user_slack_id} sent {emoji_name} to {target_user_slack_id} "
-                f"(score: {emoji_score}, type: {usage_type})"
+        logger.info("Bulk tracked %s emoji usage events", len(rows))
+        return len(rows)
+
+    def _insert_usage_rows(self, rows: List[Dict[str, Any]]) -> None:
+        """Insert usage rows with Core and add them to the aggregated stats."""
+        self.db.execute(_USAGE_INSERT, rows)
+        
+        # Aggregate per (user, emoji) so each stats row is touched once
+        deltas: Dict[Tuple[int, str], List[int]] = defaultdict(lambda: [0, 0, 0, 0])
+        for row in rows:
+            count = row.get("count", 1)
+            given = deltas[(row["user_id"], row["emoji_name"])]
+            given[0] += count
+            given[1] += row["emoji_score"]
+            if row.get("target_user_id"):
+                received = deltas[(row["target_user_id"], row["emoji_name"])]
+                received[2] += count
+                received[3] += row["emoji_score"]
+        
+        self._apply_emoji_stats_deltas(deltas)
+        self._apply_channel_stats_deltas(rows)
+        
+        invalidate_leaderboard_cache()
+
+    def track_message_emojis(
+        self,
+        user_slack_id: str,
+        emoji_counts: Dict[str, int],
+        channel_slack_id: Optional[str] = None,
+        message_ts: Optional[str] = None,
+        message_text: Optional[str] = None,
+        target_user_slack_ids: Optional[List[str]] = None,
+    ) -> List[str]:
+        """Track every emoji in a message, once per target user, in one bulk insert.
+
+        ``emoji_counts`` maps emoji names to their occurrences in the message;
+        repeated emojis are stored as one row with a count and a multiplied
+        score. Returns the distinct names of the emojis that were tracked.
+        """
+        scores = {name: config.get_emoji_score(name) for name in emoji_counts}
+        tracked_emojis = [name for name in emoji_counts if scores[name] != 0]
+        if not tracked_emojis:
+            logger.debug("No tracked emojis in message from %s", user_slack_id)
+            return []
+        
+        # Resolve users and channel once for the whole message
+        user_id = self._get_user_id(user_slack_id)
+        channel_id = self._get_channel_id(channel_slack_id) if channel_slack_id else None
+        
+        # Targets are resolved together: one IN query for the unknown users
+        target_user_ids: List[Optional[int]] = [None]
+        if target_user_slack_ids:
+            target_user_ids = list(self._get_user_ids(target_user_slack_ids).values())
+            if not target_user_ids:
+                logger.warning(
+                    "Dropping message %s from %s: none of its targets %s resolved",
+                    message_ts, user_slack_id, target_user_slack_ids
+                )
+                return []
+        
+        rows = [
+            {
+                "user_id": user_id,
+                "channel_id": channel_id,
+                "emoji_name": name,
+                "emoji_score": scores[name] * emoji_counts[name],
+                "count": emoji_counts[name],
+                "usage_type": "message",
+                "message_ts": message_ts,
+                "message_text": message_text,
+                "target_user_id": target_user_id,
+            }
+            for target_user_id in target_user_ids
+            for name in tracked_emojis
+        ]
+        self.bulk_track_emoji_usage(rows)
+        
+        return tracked_emojis
+
+    def _apply_emoji_stats_deltas(self, deltas: Dict[Tuple[int, str], List[int]]) -> None:
+        """Add deltas to users' aggregated stats in one multi-row upsert.
+
+        ``deltas`` maps (user_id, emoji_name) to
+        [given_count, given_score, received_count, received_score].
+        """
+        # Sorted so concurrent upserts lock stats rows in the same order
+        rows = [
+            {
+                "user_id": user_id,
+                "emoji_name": emoji_name,
+                "given_count": delta[0],
+                "given_score": delta[1],
+                "received_count": delta[2],
+                "received_score": delta[3],
+                "first_used": func.now(),
+                "last_used": func.now(),
+            }
+            for (user_id, emoji_name), delta in sorted(deltas.items())
+        ]
+        
+        table = EmojiStats.__table__.c
+        for start in range(0, len(rows), STATS_UPSERT_BATCH_SIZE):
+            stmt = _dialect_insert(self.db, EmojiStats).values(
+                rows[start:start + STATS_UPSERT_BATCH_SIZE]
             )
-        else:
-            logger.info(
-                f"Tracked emoji usage: {user_slack_id} used {emoji_name} "
-                f"(score: {emoji_score}, type: {usage_type})"
+            # Increment in the database so concurrent events cannot lose updates
+            stmt = stmt.on_conflict_do_update(
+                index_elements=[EmojiStats.user_id, EmojiStats.emoji_name],
+                set_={
+                    "given_count": table.given_count + stmt.excluded.given_count,
+                    "given_score": table.given_score + stmt.excluded.given_score,
+                    "received_count": table.received_count + stmt.excluded.received_count,
+                    "received_score": table.received_score + stmt.excluded.received_score,
+                    "last_used": func.now(),
+                    "updated_at": func.now(),
+                },
             )
+            self.db.execute(stmt)
         
-        return usage
+        # Keep the per-user totals in step, in user order like the stats rows
+        user_deltas: Dict[int, List[int]] = {}
+        for (user_id, _), delta in deltas.items():
+            totals = user_deltas.setdefault(user_id, [0, 0, 0, 0])
+            for i, value in enumerate(delta):
+                totals[i] += value
+        self.db.execute(
+            _USER_TOTALS_UPDATE,
+            [
+                {
+                    "user_pk": user_id,
+                    "given_count": totals[0],
+                    "given_score": totals[1],
+                    "received_count": totals[2],
+                    "received_score": totals[3],
+                }
+                for user_id, totals in sorted(user_deltas.items())
+            ],
+        )
 
-    def _update_emoji_stats(
-        self, user_id: int, emoji_name: str, score: int, stat_type: str
-    ) -> None:
-        """Update aggregated emoji statistics."""
-        stats = (
-            self.db.query(EmojiStats)
-            .filter(
-                and_(EmojiStats.user_id == user_id, EmojiStats.emoji_name == emoji_name)
+    def _apply_channel_stats_deltas(self, rows: List[Dict[str, Any]]) -> None:
+        """Add usage rows to the per-channel emoji and user totals."""
+        emoji_deltas: Dict[Tuple[int, str], List[int]] = defaultdict(lambda: [0, 0])
+        user_deltas: Dict[Tuple[int, int], List[int]] = defaultdict(lambda: [0, 0])
+        for row in rows:
+            if not row.get("channel_id"):
+                continue
+            count = row.get("count", 1)
+            for delta in (
+                emoji_deltas[(row["channel_id"], row["emoji_name"])],
+                user_deltas[(row["channel_id"], row["user_id"])],
+            ):
+                delta[0] += count
+                delta[1] += row["emoji_score"]
+        
+        # Sorted so concurrent upserts lock rows in the same order
+        for model, key_column, deltas in (
+            (ChannelEmojiStats, "emoji_name", emoji_deltas),
+            (ChannelUserStats, "user_id", user_deltas),
+        ):
+            values = [
+                {"channel_id": channel_id, key_column: key, "count": delta[0], "score": delta[1]}
+                for (channel_id, key), delta in sorted(deltas.items())
+            ]
+            table = model.__table__.c
+            for start in range(0, len(values), STATS_UPSERT_BATCH_SIZE):
+                stmt = _dialect_insert(self.db, model).values(
+                    values[start:start + STATS_UPSERT_BATCH_SIZE]
+                )
+                stmt = stmt.on_conflict_do_update(
+                    index_elements=[table.channel_id, table[key_column]],
+                    set_={
+                        "count": table["count"] + stmt.excluded["count"],
+                        "score": table.score + stmt.excluded.score,
+                        "updated_at": func.now(),
+                    },
+                )
+                self.db.execute(stmt)
+
+    def rebuild_emoji_stats(self) -> int:
+        """Recompute all aggregated emoji statistics from the usage log.
+
+        Replaces the contents of ``emoji_stats`` and the per-channel stats
+        tables with INSERT ... SELECT, so drifted or missing rows can be
+        repaired without replaying events. Returns the number of
+        ``emoji_stats`` rows written.
+        """
+        usage_rows = union_all(
+            select(
+                EmojiUsage.user_id.label("user_id"),
+                EmojiUsage.emoji_name.label("emoji_name"),
+                EmojiUsage.count.label("given_count"),
+                EmojiUsage.emoji_score.label("given_score"),
+                literal(0).label("received_count"),
+                literal(0).label("received_score"),
+                EmojiUsage.created_at.label("created_at"),
+            ),
+            select(
+                EmojiUsage.target_user_id,
+                EmojiUsage.emoji_name,
+                literal(0),
+                literal(0),
+                EmojiUsage.count,
+                EmojiUsage.emoji_score,
+                EmojiUsage.created_at,
+            ).where(EmojiUsage.target_user_id.isnot(None)),
+        ).subquery()
+        
+        aggregated = select(
+            usage_rows.c.user_id,
+            usage_rows.c.emoji_name,
+            func.sum(usage_rows.c.given_count),
+            func.sum(usage_rows.c.given_score),
+            func.sum(usage_rows.c.received_count),
+            func.sum(usage_rows.c.received_score),
+            func.min(usage_rows.c.created_at),
+            func.max(usage_rows.c.created_at),
+        ).group_by(usage_rows.c.user_id, usage_rows.c.emoji_name)
+        
+        self.db.execute(delete(EmojiStats))
+        result = self.db.execute(
+            insert(EmojiStats).from_select(
+                [
+                    "user_id",
+                    "emoji_name",
+                    "given_count",
+                    "given_score",
+                    "received_count",
+                    "received_score",
+                    "first_used",
+                    "last_used",
+                ],
+                aggregated,
             )
-            .first()
         )
         
-        if not stats:
-            stats = EmojiStats(
-                user_id=user_id,
-                emoji_name=emoji_name,
-                given_count=0,
-                given_score=0,
-                received_count=0,
-                received_score=0,
-                first_used=datetime.utcnow(),
+        # Re-derive the per-user totals from the rebuilt rows
+        def user_total(column: Any) -> Any:
+            return func.coalesce(
+                select(func.sum(column))
+                .where(EmojiStats.user_id == User.id)
+                .scalar_subquery(),
+                0,
+            )
+        
+        self.db.execute(
+            update(User).values(
+                total_given_count=user_total(EmojiStats.given_count),
+                total_given_score=user_total(EmojiStats.given_score),
+                total_received_count=user_total(EmojiStats.received_count),
+                total_received_score=user_total(EmojiStats.received_score),
             )
-            self.db.add(stats)
+        )
         
-        # Update stats based on type
-        if stat_type == "given":
-            stats.given_count = (stats.given_count or 0) + 1
-            stats.given_score = (stats.given_score or 0) + score
-        elif stat_type == "received":
-            stats.received_count = (stats.received_count or 0) + 1
-            stats.received_score = (stats.received_score or 0) + score
+        # Per-channel totals are plain sums over the channel's usage rows
+        channel_usage = EmojiUsage.channel_id.isnot(None)
+        self.db.execute(delete(ChannelEmojiStats))
+        self.db.execute(
+            insert(ChannelEmojiStats).from_select(
+                ["channel_id", "emoji_name", "count", "score"],
+                select(
+                    EmojiUsage.channel_id,
+                    EmojiUsage.emoji_name,
+                    func.sum(EmojiUsage.count),
+                    func.coalesce(func.sum(EmojiUsage.emoji_score), 0),
+                )
+                .where(channel_usage)
+                .group_by(EmojiUsage.channel_id, EmojiUsage.emoji_name),
+            )
+        )
+        self.db.execute(delete(ChannelUserStats))
+        self.db.execute(
+            insert(ChannelUserStats).from_select(
+                ["channel_id", "user_id", "count", "score"],
+                select(
+                    EmojiUsage.channel_id,
+                    EmojiUsage.user_id,
+                    func.sum(EmojiUsage.count),
+                    func.coalesce(func.sum(EmojiUsage.emoji_score), 0),
+                )
+                .where(channel_usage)
+                .group_by(EmojiUsage.channel_id, EmojiUsage.user_id),
+            )
+        )
+        invalidate_leaderboard_cache()
         
-        stats.last_used = datetime.utcnow()
+        logger.info("Rebuilt %s emoji stats rows from usage history", result.rowcount)
+        return result.rowcount
 
     def get_user_stats(self, slack_id: str) -> Optional[Dict]:
         """Get comprehensive statistics for a user."""
-        user = self.db.query(User).filter(User.slack_id == slack_id).first()
-        if not user:
-            return None
-        
-        # Get aggregated stats
-        stats_query = (
-            self.db.query(
-                func.sum(EmojiStats.given_count).label("total_given_count"),
-                func.sum(EmojiStats.given_score).label("total_given_score"),
-                func.sum(EmojiStats.received_count).label("total_received_count"),
-                func.sum(EmojiStats.received_score).label("total_received_score"),
+        # Each top list is its own ORDER BY ... LIMIT 10 so it is read from
+        # the per-user score index; both are outer-joined to the user row,
+        # whose totals are kept up to date, so the whole call is one query
+        user_pk = select(User.id).where(User.slack_id == slack_id).scalar_subquery()
+        top_lists = [
+            select(
+                literal(kind).label("kind"),
+                EmojiStats.user_id,
+                EmojiStats.emoji_name,
+                count_column.label("count"),
+                score_column.label("score"),
             )
-            .filter(EmojiStats.user_id == user.id)
-            .first()
-        )
-        
-        # Get top emojis given and received
-        top_given = (
-            self.db.query(EmojiStats)
-            .filter(EmojiStats.user_id == user.id)
-            .filter(EmojiStats.given_count > 0)
-            .order_by(desc(EmojiStats.given_score))
+            .where(EmojiStats.user_id == user_pk, count_column > 0)
+            .order_by(desc(score_column))
             .limit(10)
+            .subquery()
+            for kind, count_column, score_column in (
+                ("given", EmojiStats.given_count, EmojiStats.given_score),
+                ("received", EmojiStats.received_count, EmojiStats.received_score),
+            )
+        ]
+        top = union_all(*(select(top_list) for top_list in top_lists)).subquery()
+        rows = (
+            self.db.query(
+                User.slack_id,
+                User.display_name,
+                User.real_name,
+                User.email,
+                User.total_given_count,
+                User.total_given_score,
+                User.total_received_count,
+                User.total_received_score,
+                top.c.kind,
+                top.c.emoji_name,
+                top.c["count"],
+                top.c.score,
+            )
+            .outerjoin(top, top.c.user_id == User.id)
+            .filter(User.slack_id == slack_id)
+            .order_by(desc(top.c.score))
             .all()
         )
+        if not rows:
+            return None
         
-        top_received = (
-            self.db.query(EmojiStats)
-            .filter(EmojiStats.user_id == user.id)
-            .filter(EmojiStats.received_count > 0)
-            .order_by(desc(EmojiStats.received_score))
-            .limit(10)
-            .all()
-        )
+        user = rows[0]
+        top_given = [row for row in rows if row.kind == "given"]
+        top_received = [row for row in rows if row.kind == "received"]
         
         return {
             "user": {
@@ -257,64 +901,79 @@ class EmojiService:
                 "email": user.email,
             },
             "totals": {
-                "given_count": stats_query.total_given_count or 0,
-                "given_score": stats_query.total_given_score or 0,
-                "received_count": stats_query.total_received_count or 0,
-                "received_score": stats_query.total_received_score or 0,
+                "given_count": user.total_given_count,
+                "given_score": user.total_given_score,
+                "received_count": user.total_received_count,
+                "received_score": user.total_received_score,
             },
             "top_given": [
-                {
-                    "emoji": stat.emoji_name,
-                    "count": stat.given_count,
-                    "score": stat.given_score,
-                }
+                {"emoji": stat.emoji_name, "count": stat.count, "score": stat.score}
                 for stat in top_given
             ],
             "top_received": [
-                {
-                    "emoji": stat.emoji_name,
-                    "count": stat.received_count,
-                    "score": stat.received_score,
-                }
+                {"emoji": stat.emoji_name, "count": stat.count, "score": stat.score}
                 for stat in top_received
             ],
         }
 
     def get_leaderboard(
-        self, sort_by: str = "received_score", limit: int = 50
+        self, sort_by: str = LeaderboardSort.received_score, limit: int = 50
     ) -> List[Dict]:
-        """Get leaderboard data sorted by various metrics."""
-        valid_sort_options = [
-            "received_score",
-            "received_count",
-            "given_score",
-            "given_count",
-        ]
-        
-        if sort_by not in valid_sort_options:
-            sort_by = "received_score"
+        """Get leaderboard data sorted by various metrics.
+
+        Results are cached for ``LEADERBOARD_CACHE_TTL_SECONDS`` per sort
+        column and limit, and only one query per key runs at a time. If the
+        query fails, the last result for the key is returned when there is one.
+        """
+        # Unknown sort options fall back to received score
+        sort_column = _LEADERBOARD_SORT_COLUMNS.get(
+            sort_by, User.total_received_score
+        )
+        cache_key = (sort_column.key, limit)
         
-        # Map sort_by to aggregation
-        if sort_by == "received_score":
-            sort_field = func.sum(EmojiStats.received_score)
-        elif sort_by == "received_count":
-            sort_field = func.sum(EmojiStats.received_count)
-        elif sort_by == "given_score":
-            sort_field = func.sum(EmojiStats.given_score)
-        else:  # given_count
-            sort_field = func.sum(EmojiStats.given_count)
+        with _leaderboard_cache_lock:
+            cached = _leaderboard_cache.get(cache_key)
+            fill_lock = _leaderboard_fill_locks[cache_key]
+        if cached is not None:
+            return cached
         
+        # Requests that miss together wait for the first one to fill the cache
+        with fill_lock:
+            with _leaderboard_cache_lock:
+                cached = _leaderboard_cache.get(cache_key)
+            if cached is not None:
+                return cached
+            
+            try:
+                leaderboard = self._query_leaderboard(sort_column, limit)
+            except SQLAlchemyError:
+                with _leaderboard_cache_lock:
+                    stale = _leaderboard_stale.get(cache_key)
+                if stale is None:
+                    raise
+                logger.warning("Leaderboard query failed, serving last result", exc_info=True)
+                return stale
+            
+            with _leaderboard_cache_lock:
+                _leaderboard_cache[cache_key] = leaderboard
+                _leaderboard_stale[cache_key] = leaderboard
+        return leaderboard
+
+    def _query_leaderboard(self, sort_column: Any, limit: int) -> List[Dict]:
+        """Read the top users by one of their denormalized totals."""
         results = (
             self.db.query(
-                User,
-                func.sum(EmojiStats.given_count).label("total_given_count"),
-                func.sum(EmojiStats.given_score).label("total_given_score"),
-                func.sum(EmojiStats.received_count).label("total_received_count"),
-                func.sum(EmojiStats.received_score).label("total_received_score"),
+                User.slack_id,
+                User.display_name,
+                User.real_name,
+                User.total_given_count,
+                User.total_given_score,
+                User.total_received_count,
+                User.total_received_score,
             )
-            .join(EmojiStats, User.id == EmojiStats.user_id)
-            .group_by(User.id)
-            .order_by(desc(sort_field))
+            # Only users with any emoji activity are ranked
+            .filter((User.total_given_count > 0) | (User.total_received_count > 0))
+            .order_by(desc(sort_column))
             .limit(limit)
             .all()
         )
@@ -323,70 +982,135 @@ class EmojiService:
             {
                 "rank": idx + 1,
                 "user": {
-                    "slack_id": result.User.slack_id,
-                    "display_name": result.User.display_name,
-                    "real_name": result.User.real_name,
+                    "slack_id": result.slack_id,
+                    "display_name": result.display_name,
+                    "real_name": result.real_name,
                 },
                 "stats": {
-                    "given_count": result.total_given_count or 0,
-                    "given_score": result.total_given_score or 0,
-                    "received_count": result.total_received_count or 0,
-                    "received_score": result.total_received_score or 0,
+                    "given_count": result.total_given_count,
+                    "given_score": result.total_given_score,
+                    "received_count": result.total_received_count,
+                    "received_score": result.total_received_score,
                 },
             }
             for idx, result in enumerate(results)
         ]
 
     def get_user_history(
-        self, slack_id: str, limit: int = 100, offset: int = 0
+        self,
+        slack_id: str,
+        limit: int = 100,
+        offset: int = 0,
+        cursor: Optional[str] = None,
+        include_total: bool = False,
     ) -> Optional[Dict]:
-        """Get recent emoji usage history for a user."""
-        user = self.db.query(User).filter(User.slack_id == slack_id).first()
+        """Get recent emoji usage history for a user.
+
+        Pages with ``offset`` or, when given, a ``cursor`` from a previous
+        page's ``next_cursor``, which seeks straight to the next page.
+        The total is only counted for the first page unless ``include_total``
+        is set; later pages report it as None.
+        """
+        user = (
+            self.db.query(User.id, User.slack_id, User.display_name)
+            .filter(User.slack_id == slack_id)
+            .first()
+        )
         if not user:
             return None
         
-        history = (
-            self.db.query(EmojiUsage)
-            .filter(EmojiUsage.user_id == user.id)
-            .order_by(desc(EmojiUsage.created_at))
-            .offset(offset)
-            .limit(limit)
-            .all()
-        )
-        
-        total_count = (
-            self.db.query(func.count(EmojiUsage.id))
+        # Select only the rendered columns to skip ORM object hydration
+        query = (
+            self.db.query(
+                EmojiUsage.id,
+                EmojiUsage.emoji_name,
+                EmojiUsage.emoji_score,
+                EmojiUsage.usage_type,
+                EmojiUsage.created_at,
+            )
             .filter(EmojiUsage.user_id == user.id)
-            .scalar()
+            .order_by(desc(EmojiUsage.created_at), desc(EmojiUsage.id))
         )
+        if cursor:
+            query = query.filter(
+                tuple_(EmojiUsage.created_at, EmojiUsage.id) < decode_history_cursor(cursor)
+            )
+        else:
+            query = query.offset(offset)
         
-        return {
-            "user": {
-                "slack_id": user.slack_id,
-                "display_name": user.display_name,
-            },
-            "history": [
+        # Fetch one extra row to know whether another page follows; rows are
+        # streamed in batches and rendered as they arrive instead of being
+        # buffered as a full result first
+        rows = query.limit(limit + 1).execution_options(yield_per=HISTORY_YIELD_PER)
+        history = []
+        has_more = False
+        last_usage = None
+        for usage in rows:
+            # Consume the extra row rather than breaking, so the cursor is drained
+            if len(history) == limit:
+                has_more = True
+                continue
+            history.append(
                 {
                     "emoji": usage.emoji_name,
                     "score": usage.emoji_score,
                     "type": usage.usage_type,
                     "timestamp": usage.created_at.isoformat(),
                 }
-                for usage in history
-            ],
+            )
+            last_usage = usage
+        next_cursor = None
+        if has_more:
+            next_cursor = encode_history_cursor(last_usage.created_at, last_usage.id)
+        
+        total_count = None
+        first_page = cursor is None and offset == 0
+        if include_total or first_page:
+            # A first page with nothing after it already holds every entry
+            if first_page and not has_more:
+                total_count = len(history)
+            else:
+                total_count = (
+                    self.db.query(func.count(EmojiUsage.id))
+                    .filter(EmojiUsage.user_id == user.id)
+                    .scalar()
+                )
+        
+        return {
+            "user": {
+                "slack_id": user.slack_id,
+                "display_name": user.display_name,
+            },
+            "history": history,
             "pagination": {
                 "total": total_count,
                 "limit": limit,
-                "offset": offset,
-                "has_more": (offset + limit) < total_count,
+                "offset": 0 if cursor else offset,
+                "has_more": has_more,
+                "next_cursor": next_cursor,
             },
         }
 
     def extract_emojis_from_text(self, text: str) -> List[str]:
         """Extract emoji names from message text."""
-        # Find all emojis in format :emoji_name:
-        emoji_pattern = r":([a-zA-Z0-9_+-]+):"
-        return re.findall(emoji_pattern, text)
+        # Most messages contain no emoji at all, so skip the regex scan
+        if ":" not in text:
+            return []
+        return list(_find_emoji_names(text))
+
+    def count_emojis_in_text(self, text: str) -> Counter:
+        """Count occurrences of each tracked emoji name in message text.
+
+        Untracked emojis are dropped here so messages without any tracked
+        emoji can be skipped before users or mentions are resolved.
+        """
+        if ":" not in text:
+            return Counter()
+        return Counter(
+            name
+            for name in _find_emoji_names(text)
+            if config.should_track_emoji(name)
+        )
 
     def extract_user_mentions(self, text: str, event_payload: Optional[Dict[str, Any]] = None) -> List[str]:
         """Extract user IDs from Slack message text and event payload.
@@ -396,26 +1120,33 @@ class EmojiService:
         2. Event payload blocks/elements (for rich text)
         3. Display format: @username (attempts to resolve via Slack API)
         """
+        # Most messages mention nobody; both text formats need an "@"
+        has_text_mentions = "@" in text
+        if not has_text_mentions and not event_payload:
+            return []
+        
         user_ids = []
         
         # Method 1: Extract from event payload blocks (most reliable)
         if event_payload:
             payload_mentions = self._extract_mentions_from_payload(event_payload)
             user_ids.extend(payload_mentions)
-            logger.debug(f'Payload mentions: {payload_mentions}')
+            logger.debug('Payload mentions: %s', payload_mentions)
         
         # Method 2: Extract Slack's internal format <@USER_ID> from text
-        slack_mention_pattern = r"<@([A-Z0-9]+)(?:\|[^>]+)?>"
-        slack_mentions = re.findall(slack_mention_pattern, text)
-        user_ids.extend(slack_mentions)
-        
-        # Method 3: Extract display format @username and try to resolve them
-        display_mention_pattern = r"@([a-zA-Z0-9._-]+)"
-        display_mentions = re.findall(display_mention_pattern, text)
+        slack_mentions: Tuple[str, ...] = ()
+        if "<@" in text:
+            slack_mentions = _find_slack_mentions(text)
+            user_ids.extend(slack_mentions)
         
-        # Remove display mentions that are part of slack mentions (avoid duplicates)
-        text_without_slack_mentions = re.sub(slack_mention_pattern, "", text)
-        display_mentions = re.findall(display_mention_pattern, text_without_slack_mentions)
+        # Method 3: Extract display format @username and try to resolve them,
+        # skipping the ones that are part of slack mentions (avoid duplicates)
+        display_mentions = []
+        if has_text_mentions:
+            text_without_slack_mentions = (
+                _SLACK_MENTION_PATTERN.sub("", text) if slack_mentions else text
+            )
+            display_mentions = _DISPLAY_MENTION_PATTERN.findall(text_without_slack_mentions)
         
         # Try to resolve display names to user IDs if we have a web client
         if display_mentions and self.web_client:
@@ -425,9 +1156,9 @@ class EmojiService:
         # Remove duplicates while preserving order
         unique_user_ids = list(dict.fromkeys(user_ids))
         
-        logger.debug(f'Slack mentions: {slack_mentions}')
-        logger.debug(f'Display mentions: {display_mentions}')
-        logger.debug(f'Final user IDs: {unique_user_ids}')
+        logger.debug('Slack mentions: %s', slack_mentions)
+        logger.debug('Display mentions: %s', display_mentions)
+        logger.debug('Final user IDs: %s', unique_user_ids)
         
         return unique_user_ids
 
@@ -468,29 +1199,37 @@ class EmojiService:
                     user_ids.extend(user_mentions)
         
         except Exception as e:
-            logger.warning(f"Error extracting mentions from payload: {e}")
+            logger.warning("Error extracting mentions from payload: %s", e)
         
         return user_ids
 
-    def _resolve_display_names_to_user_ids(self, display_names: List[str]) -> List[str]:
-        """Resolve display names to Slack user IDs using the Slack API."""
-        resolved_ids = []
+    def _get_user_lookup_maps(
+        self,
+    ) -> Optional[Tuple[Dict[str, str], Dict[str, str], Dict[str, str], Dict[str, str]]]:
+        """Get (username, display name, real name, real name word) -> user ID maps.
+
+        Built from every page of users.list and cached for
+        ``USER_LOOKUP_TTL_SECONDS``. Returns None if the list could not be fetched.
+        """
+        cache_key = self.web_client.token
+        with _user_lookup_cache_lock:
+            lookup_maps = _user_lookup_cache.get(cache_key)
+        if lookup_maps is not None:
+            return lookup_maps
         
-        try:
-            # Get all users from the workspace
-            response = self.web_client.users_list(limit=1000)
+        username_to_id = {}  # Slack username (without @)
+        display_name_to_id = {}  # Display name
+        real_name_to_id = {}  # Real name
+        real_name_token_to_id = {}  # Each word of a real name, first user wins
+        
+        cursor = None
+        while True:
+            response = self.web_client.users_list(limit=1000, cursor=cursor)
             if not response.get("ok"):
                 logger.warning("Failed to fetch users list from Slack API")
-                return resolved_ids
+                return None
             
-            users = response.get("members", [])
-            
-            # Create lookup maps for different name formats
-            username_to_id = {}  # Slack username (without @)
-            display_name_to_id = {}  # Display name
-            real_name_to_id = {}  # Real name
-            
-            for user in users:
+            for user in response.get("members", []):
                 if user.get("deleted") or user.get("is_bot"):
                     continue
                     
@@ -506,6 +1245,36 @@ class EmojiService:
                     display_name_to_id[display_name] = user_id
                 if user_id and real_name:
                     real_name_to_id[real_name] = user_id
+                    for token in real_name.split():
+                        real_name_token_to_id.setdefault(token, user_id)
+            
+            cursor = response.get("response_metadata", {}).get("next_cursor")
+            if not cursor:
+                break
+        
+        lookup_maps = (username_to_id, display_name_to_id, real_name_to_id, real_name_token_to_id)
+        with _user_lookup_cache_lock:
+            _user_lookup_cache[cache_key] = lookup_maps
+            _unresolved_mentions.clear()
+        return lookup_maps
+
+    def _resolve_display_names_to_user_ids(self, display_names: List[str]) -> List[str]:
+        """Resolve display names to Slack user IDs using the Slack API."""
+        resolved_ids = []
+        
+        # Names that recently matched nobody are not looked up again
+        with _user_lookup_cache_lock:
+            display_names = [
+                name for name in display_names if name.lower() not in _unresolved_mentions
+            ]
+        if not display_names:
+            return resolved_ids
+        
+        try:
+            lookup_maps = self._get_user_lookup_maps()
+            if lookup_maps is None:
+                return resolved_ids
+            username_to_id, display_name_to_id, real_name_to_id, real_name_token_to_id = lookup_maps
             
             # Try to resolve each display name
             for name in display_names:
@@ -519,6 +1288,9 @@ class EmojiService:
                     user_id = display_name_to_id[name_lower]
                 elif name_lower in real_name_to_id:
                     user_id = real_name_to_id[name_lower]
+                elif name_lower in real_name_token_to_id:
+                    # A first or last name; found without scanning every user
+                    user_id = real_name_token_to_id[name_lower]
                 else:
                     for real_name, uid in real_name_to_id.items():
                         if name_lower in real_name or real_name in name_lower:
@@ -527,12 +1299,14 @@ class EmojiService:
                 
                 if user_id:
                     resolved_ids.append(user_id)
-                    logger.info(f"Resolved display name '{name}' to user ID '{user_id}'")
+                    logger.info("Resolved display name '%s' to user ID '%s'", name, user_id)
                 else:
-                    logger.warning(f"Could not resolve display name '{name}' to user ID")
+                    with _user_lookup_cache_lock:
+                        _unresolved_mentions[name_lower] = True
+                    logger.warning("Could not resolve display name '%s' to user ID", name)
         
         except Exception as e:
-            logger.error(f"Error resolving display names to user IDs: {e}")
+            logger.error("Error resolving display names to user IDs: %s", e)
         
         return resolved_ids
 
@@ -540,70 +1314,65 @@ class EmojiService:
         """Ensure all mentioned users exist in the database, create them if they don't."""
         users = []
         
+        # Load every already-known user in one query
+        existing_users = {}
+        if user_ids:
+            existing_users = {
+                user.slack_id: user
+                for user in self.db.query(User).filter(User.slack_id.in_(set(user_ids)))
+            }
+        
         for user_id in user_ids:
             try:
-                # Try to get existing user
-                user = self.db.query(User).filter(User.slack_id == user_id).first()
+                user = existing_users.get(user_id)
                 
                 if not user:
                     # User doesn't exist, create them by fetching from Slack API
-                    logger.info(f"Creating new user from mention: {user_id}")
+                    logger.info("Creating new user from mention: %s", user_id)
                     user = self.create_or_update_user(
                         slack_id=user_id,
                         fetch_from_slack=True
                     )
+                    existing_users[user_id] = user
                 
                 if user:
                     users.append(user)
                     
             except Exception as e:
-                logger.error(f"Error ensuring user {user_id} exists: {e}")
+                logger.error("Error ensuring user %s exists: %s", user_id, e)
         
         return users
 
     def get_channel_stats(self, channel_slack_id: str) -> Optional[Dict]:
         """Get emoji statistics for a specific channel."""
         channel = (
-            self.db.query(Channel).filter(Channel.slack_id == channel_slack_id).first()
+            self.db.query(Channel.id, Channel.slack_id, Channel.name, Channel.is_private)
+            .filter(Channel.slack_id == channel_slack_id)
+            .first()
         )
         if not channel:
             return None
         
-        # Get total usage in this channel
-        total_usage = (
-            self.db.query(
-                func.count(EmojiUsage.id).label("total_count"),
-                func.sum(EmojiUsage.emoji_score).label("total_score"),
-            )
-            .filter(EmojiUsage.channel_id == channel.id)
-            .first()
-        )
-        
-        # Get top emojis in this channel
-        top_emojis = (
-            self.db.query(
-                EmojiUsage.emoji_name,
-                func.count(EmojiUsage.id).label("count"),
-                func.sum(EmojiUsage.emoji_score).label("score"),
-            )
-            .filter(EmojiUsage.channel_id == channel.id)
-            .group_by(EmojiUsage.emoji_name)
-            .order_by(desc(func.sum(EmojiUsage.emoji_score)))
-            .limit(10)
+        # One row per emoji used in the channel; the channel totals and the
+        # top emojis are both derived from them
+        emoji_totals = (
+            self.db.query(ChannelEmojiStats.emoji_name, ChannelEmojiStats.count, ChannelEmojiStats.score)
+            .filter(ChannelEmojiStats.channel_id == channel.id)
             .all()
         )
+        top_emojis = sorted(emoji_totals, key=lambda emoji: emoji.score, reverse=True)[:10]
         
         # Get top users in this channel
         top_users = (
             self.db.query(
-                User,
-                func.count(EmojiUsage.id).label("count"),
-                func.sum(EmojiUsage.emoji_score).label("score"),
+                User.slack_id,
+                User.display_name,
+                ChannelUserStats.count,
+                ChannelUserStats.score,
             )
-            .join(EmojiUsage, User.id == EmojiUsage.user_id)
-            .filter(EmojiUsage.channel_id == channel.id)
-            .group_by(User.id)
-            .order_by(desc(func.sum(EmojiUsage.emoji_score)))
+            .join(ChannelUserStats, User.id == ChannelUserStats.user_id)
+            .filter(ChannelUserStats.channel_id == channel.id)
+            .order_by(desc(ChannelUserStats.score))
             .limit(10)
             .all()
         )
@@ -615,8 +1384,8 @@ class EmojiService:
                 "is_private": channel.is_private,
             },
             "totals": {
-                "total_count": total_usage.total_count or 0,
-                "total_score": total_usage.total_score or 0,
+                "total_count": sum(emoji.count for emoji in emoji_totals),
+                "total_score": sum(emoji.score for emoji in emoji_totals),
             },
             "top_emojis": [
                 {
@@ -629,8 +1398,8 @@ class EmojiService:
             "top_users": [
                 {
                     "user": {
-                        "slack_id": result.User.slack_id,
-                        "display_name": result.User.display_name,
+                        "slack_id": result.slack_id,
+                        "display_name": result.display_name,
                     },
                     "count": result.count,
                     "score": result.score,
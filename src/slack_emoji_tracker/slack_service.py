@@ -2,20 +2,36 @@
 
 import asyncio
 import logging
-from datetime import datetime
-from typing import Any, Dict, Optional
+import time
+from contextlib import aclosing
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, List, Optional, Set, Tuple
 
-from slack_sdk.socket_mode import SocketModeClient
+from cachetools import TTLCache
+from slack_sdk.http_retry.builtin_async_handlers import AsyncRateLimitErrorRetryHandler
+from slack_sdk.http_retry.builtin_handlers import RateLimitErrorRetryHandler
+from slack_sdk.socket_mode.aiohttp import SocketModeClient
 from slack_sdk.socket_mode.request import SocketModeRequest
 from slack_sdk.socket_mode.response import SocketModeResponse
 from slack_sdk.web import WebClient
+from slack_sdk.web.async_client import AsyncWebClient
 
 from .config import config
 from .database import get_db_session
-from .service import EmojiService
+from .service import EmojiService, invalidate_user_lookup_cache
 
 logger = logging.getLogger(__name__)
 
+# Reactions cluster on the same messages, so message authors are remembered
+MESSAGE_AUTHOR_TTL_SECONDS = 24 * 60 * 60
+
+# Retries after a 429, honouring Retry-After, before a Web API call fails;
+# paginated users.list/conversations.list walks hit Tier 2 limits first
+SLACK_RATE_LIMIT_RETRIES = 3
+
+# Event handlers running at once; later events queue behind them instead of
+# piling up worker threads and database connections during reaction storms
+MAX_CONCURRENT_EVENTS = 64
+
 
 class SlackService:
     """Service for handling Slack events and emoji tracking."""
@@ -24,52 +40,93 @@ class SlackService:
         """Initialize the Slack service."""
         config.validate_required_config()
         
+        # Events are handled on the event loop with the async client; the sync
+        # client is handed to EmojiService, which runs in worker threads
+        self.async_web_client = AsyncWebClient(token=config.slack_bot_token)
         self.web_client = WebClient(token=config.slack_bot_token)
-        self.socket_client = SocketModeClient(
-            app_token=config.slack_app_token,
-            web_client=self.web_client,
+        self.async_web_client.retry_handlers.append(
+            AsyncRateLimitErrorRetryHandler(max_retry_count=SLACK_RATE_LIMIT_RETRIES)
         )
+        self.web_client.retry_handlers.append(
+            RateLimitErrorRetryHandler(max_retry_count=SLACK_RATE_LIMIT_RETRIES)
+        )
+        
+        # Created by start(); the aiohttp client needs a running event loop
+        self.socket_client: Optional[SocketModeClient] = None
         
-        # Register event handlers
-        self.socket_client.socket_mode_request_listeners.append(
-            self._handle_socket_mode_request
+        # (channel, message ts) -> (author, text) from conversations.history
+        self._message_authors: TTLCache = TTLCache(
+            maxsize=10_000, ttl=MESSAGE_AUTHOR_TTL_SECONDS
         )
+        
+        # Slack IDs of bot users seen in syncs and user_change events; their
+        # reactions and messages are dropped before any Slack or database work
+        self._bot_users: Set[str] = set()
+        
+        # In-flight author lookups, so concurrent reactions fetch a message once
+        self._message_author_locks: Dict[Tuple[str, str], asyncio.Lock] = {}
+        
+        # Strong references to in-flight event tasks
+        self._tasks: Set[asyncio.Task] = set()
+        self._event_slots = asyncio.Semaphore(MAX_CONCURRENT_EVENTS)
 
     async def start(self) -> None:
         """Start the Slack Socket Mode connection."""
         logger.info("Starting Slack Socket Mode connection...")
         
         try:
-            # Test the connection first
-            auth_response = self.web_client.auth_test()
-            logger.info(f"Connected to Slack as: {auth_response['user']}")
-            
-            # Start the socket mode client
-            self.socket_client.connect()
+            # Start the socket mode client; opening the connection validates
+            # the app token, so there is no auth.test round trip beforehand
+            self.socket_client = SocketModeClient(
+                app_token=config.slack_app_token,
+                web_client=self.async_web_client,
+            )
+            self.socket_client.socket_mode_request_listeners.append(
+                self._handle_socket_mode_request
+            )
+            await self.socket_client.connect()
             logger.info("Slack Socket Mode connection established")
             
+            # The bot identity is only logged, so look it up alongside events
+            self._schedule_async_task(self._log_identity())
+            
         except Exception as e:
-            logger.error(f"Failed to start Slack service: {e}")
+            logger.error("Failed to start Slack service: %s", e)
             raise
 
+    async def _log_identity(self) -> None:
+        """Log which bot user the Web API token belongs to."""
+        try:
+            auth_response = await self.async_web_client.auth_test()
+            logger.info("Connected to Slack as: %s", auth_response.get("user"))
+        except Exception as e:
+            logger.warning("Could not look up the Slack bot identity: %s", e)
+
     async def stop(self) -> None:
         """Stop the Slack Socket Mode connection."""
         logger.info("Stopping Slack Socket Mode connection...")
         try:
-            self.socket_client.disconnect()
+            if self.socket_client:
+                await self.socket_client.disconnect()
+                await self.socket_client.close()
+            
+            # Queued handlers are dropped; ones already in a worker thread finish
+            for task in list(self._tasks):
+                task.cancel()
+            await asyncio.gather(*self._tasks, return_exceptions=True)
             logger.info("Slack Socket Mode connection closed")
         except Exception as e:
-            logger.error(f"Error stopping Slack service: {e}")
+            logger.error("Error stopping Slack service: %s", e)
 
-    def _handle_socket_mode_request(self, client: SocketModeClient, req: SocketModeRequest) -> None:
+    async def _handle_socket_mode_request(self, client: SocketModeClient, req: SocketModeRequest) -> None:
         """Handle incoming Socket Mode requests."""
         try:
             # Debug: Log the request type
-            logger.debug(f"Socket Mode request type: {req.type}")
+            logger.debug("Socket Mode request type: %s", req.type)
             
             # Acknowledge the request
             response = SocketModeResponse(envelope_id=req.envelope_id)
-            client.send_socket_mode_response(response)
+            await client.send_socket_mode_response(response)
             
             # Process the event asynchronously
             if req.type == "events_api":
@@ -77,40 +134,34 @@ class SlackService:
             elif req.type == "slash_commands":
                 self._schedule_async_task(self._handle_slash_command(req.payload))
             else:
-                logger.debug(f"Unhandled request type: {req.type}")
+                logger.debug("Unhandled request type: %s", req.type)
                 
         except Exception as e:
-            logger.error(f"Error handling Socket Mode request: {e}")
+            logger.error("Error handling Socket Mode request: %s", e)
+
+    def _schedule_async_task(self, coro) -> None:
+        """Run an event handler as a task so the listener can keep draining events."""
+        task = asyncio.create_task(self._run_bounded(coro))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
 
-    def _schedule_async_task(self, coro):
-        """Schedule an async task, handling event loop context properly."""
+    async def _run_bounded(self, coro) -> None:
+        """Await an event handler once one of the concurrent event slots is free."""
         try:
-            # Try to get the current event loop
-            loop = asyncio.get_running_loop()
-            # Schedule the task in the running loop
-            loop.create_task(coro)
-        except RuntimeError:
-            # No running event loop, create a new one in a thread
-            import threading
-            
-            def run_in_thread():
-                try:
-                    asyncio.run(coro)
-                except Exception as e:
-                    logger.error(f"Error running async task: {e}")
-            
-            thread = threading.Thread(target=run_in_thread, daemon=True)
-            thread.start()
+            async with self._event_slots:
+                await coro
+        finally:
+            # Handlers cancelled while queued were never started
+            coro.close()
 
     async def _handle_event(self, payload: Dict[str, Any]) -> None:
         """Handle Slack events."""
         event = payload.get("event", {})
         event_type = event.get("type")
         
-        logger.debug(f"Received event: {event_type}")
+        logger.debug("Received event: %s", event_type)
         
         try:
-            print('>>>>>', event_type)
             if event_type == "reaction_added":
                 await self._handle_reaction_added(event)
             elif event_type == "message":
@@ -119,7 +170,7 @@ class SlackService:
                 await self._handle_user_change(event)
                 
         except Exception as e:
-            logger.error(f"Error processing event {event_type}: {e}")
+            logger.error("Error processing event %s: %s", event_type, e)
 
     async def _handle_slash_command(self, payload: Dict[str, Any]) -> None:
         """Handle Slack slash commands."""
@@ -129,9 +180,9 @@ class SlackService:
         text = payload.get("text", "")
         
         # Debug: Log slash command info
-        logger.debug(f"Processing slash command {command} from {user_id}: '{text}'")
+        logger.debug("Processing slash command %s from %s: '%s'", command, user_id, text)
         
-        logger.debug(f"Received slash command: {command} from user {user_id}")
+        logger.debug("Received slash command: %s from user %s", command, user_id)
         
         try:
             if command == "/bloom":
@@ -141,18 +192,18 @@ class SlackService:
                     "user": user_id,
                     "text": text,
                     "channel": channel_id,
-                    "ts": str(datetime.utcnow().timestamp()),
+                    "ts": f"{time.time():.6f}",
                     # Include original slash command payload for mention extraction
                     "slash_command_payload": payload,
                 }
                 await self._handle_message(mock_event)
-                logger.info(f"Processed /bloom command from user {user_id} with text: '{text}'")
+                logger.info("Processed /bloom command from user %s with text: '%s'", user_id, text)
                 
             else:
-                logger.debug(f"Unhandled slash command: {command}")
+                logger.debug("Unhandled slash command: %s", command)
                 
         except Exception as e:
-            logger.error(f"Error processing slash command {command}: {e}")
+            logger.error("Error processing slash command %s: %s", command, e)
 
     async def _handle_reaction_added(self, event: Dict[str, Any]) -> None:
         """Handle reaction_added events."""
@@ -164,6 +215,13 @@ class SlackService:
             logger.warning("Missing user or reaction in reaction_added event")
             return
         
+        if user_id in self._bot_users:
+            return
+        
+        # Most reactions are not tracked; drop them before any Slack or database work
+        if not config.should_track_emoji(reaction):
+            return
+        
         # Get the target user (who received the reaction) and message text
         target_user_id = None
         message_text = None
@@ -171,120 +229,180 @@ class SlackService:
             channel_id = item.get("channel")
             message_ts = item.get("ts")
             
-            # Try to get the message to find the author and text
-            try:
-                message_info = self.web_client.conversations_history(
-                    channel=channel_id,
-                    latest=message_ts,
-                    limit=1,
-                    inclusive=True,
-                )
-                
-                messages = message_info.get("messages", [])
-                if messages:
-                    target_user_id = messages[0].get("user")
-                    message_text = messages[0].get("text", "")
-                    
-            except Exception as e:
-                logger.warning(f"Could not fetch message info: {e}")
-        
-        # Track the emoji usage
+            target_user_id, message_text = await self._get_message_author(channel_id, message_ts)
+        
+        # Track the emoji usage off the event loop
+        await asyncio.to_thread(
+            self._track_reaction,
+            user_id,
+            reaction,
+            item.get("channel"),
+            item.get("ts"),
+            message_text,
+            target_user_id,
+        )
+
+    def _track_reaction(
+        self,
+        user_id: str,
+        reaction: str,
+        channel_id: Optional[str],
+        message_ts: Optional[str],
+        message_text: Optional[str],
+        target_user_id: Optional[str],
+    ) -> None:
+        """Record a reaction in the database (runs in a worker thread)."""
         with get_db_session() as db:
             emoji_service = EmojiService(db, self.web_client)
             emoji_service.track_emoji_usage(
                 user_slack_id=user_id,
                 emoji_name=reaction,
                 usage_type="reaction",
-                channel_slack_id=item.get("channel"),
-                message_ts=item.get("ts"),
+                channel_slack_id=channel_id,
+                message_ts=message_ts,
                 message_text=message_text,
                 target_user_slack_id=target_user_id,
             )
 
+    async def _get_message_author(
+        self, channel_id: str, message_ts: str
+    ) -> Tuple[Optional[str], Optional[str]]:
+        """Get the author and text of a message, caching successful lookups.
+
+        Reactions arriving together for the same message share one
+        conversations.history call.
+        """
+        key = (channel_id, message_ts)
+        cached = self._message_authors.get(key)
+        if cached is not None:
+            return cached
+        
+        lock = self._message_author_locks.setdefault(key, asyncio.Lock())
+        async with lock:
+            cached = self._message_authors.get(key)
+            if cached is not None:
+                return cached
+            try:
+                return await self._fetch_message_author(key)
+            finally:
+                if self._message_author_locks.get(key) is lock:
+                    del self._message_author_locks[key]
+
+    async def _fetch_message_author(
+        self, key: Tuple[str, str]
+    ) -> Tuple[Optional[str], Optional[str]]:
+        """Look up a message with conversations.history and cache its author."""
+        channel_id, message_ts = key
+        try:
+            message_info = await self.async_web_client.conversations_history(
+                channel=channel_id,
+                latest=message_ts,
+                limit=1,
+                inclusive=True,
+            )
+        except Exception as e:
+            logger.warning("Could not fetch message info: %s", e)
+            return None, None
+        
+        messages = message_info.get("messages", [])
+        if not messages:
+            return None, None
+        
+        author = (messages[0].get("user"), messages[0].get("text", ""))
+        self._message_authors[key] = author
+        return author
+
     async def _handle_message(self, event: Dict[str, Any]) -> None:
         """Handle message events to track emojis in message text."""
         sender_user_id = event.get("user")
         text = event.get("text", "")
         channel = event.get("channel")
-        ts = event.get("ts")
         
         # Debug: Log basic message info
-        logger.debug(f"Processing message from {sender_user_id} in {channel}: '{text[:50]}...' ")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Processing message from %s in %s: '%s...' ", sender_user_id, channel, text[:50])
         
         # Skip bot messages and messages without text
         if not sender_user_id or not text or event.get("subtype") == "bot_message":
             return
+        if sender_user_id in self._bot_users:
+            return
+        
+        # Track in a worker thread; notifications are sent only after the
+        # tracking transaction commits
+        result = await asyncio.to_thread(self._track_message, event)
+        if result is None:
+            return
+        sender_name, mentioned_user_ids, notified_user_ids, tracked_emojis = result
+        
+        # Send ephemeral message to each receiver
+        for mentioned_user_id in notified_user_ids:
+            receiving_feedback_text = f"You have received a Bloom from {sender_name}: \n\n {text}"
+            await self.send_ephemeral_message(mentioned_user_id, receiving_feedback_text)
+            logger.info("Sent bloom notification to %s from %s", mentioned_user_id, sender_user_id)
+        
+        # Send ephemeral feedback to sender if emojis were tracked
+        if tracked_emojis:
+            if mentioned_user_ids:
+                sending_feedback_text = f"You have sent a Bloom to {len(mentioned_user_ids)} user(s): \n\n {text}"
+            else:
+                sending_feedback_text = f"You have sent a Bloom: \n\n {text}"
+            await self.send_ephemeral_message(sender_user_id, sending_feedback_text)
+            logger.info("Processed bloom from %s with %s emojis to %s users", sender_user_id, len(tracked_emojis), len(mentioned_user_ids))
+
+    def _track_message(
+        self, event: Dict[str, Any]
+    ) -> Optional[Tuple[str, List[str], List[str], List[str]]]:
+        """Record a message's emojis in one transaction (runs in a worker thread).
+
+        Returns the sender name, mentioned users, users to notify and tracked
+        emojis, or None when the message contains no tracked emojis.
+        """
+        sender_user_id = event.get("user")
+        text = event.get("text", "")
+        channel = event.get("channel")
+        ts = event.get("ts")
         
         # Extract emojis and user mentions from the message text and payload
+        notified_user_ids: List[str] = []
+        tracked_emojis: List[str] = []
         with get_db_session() as db:
             emoji_service = EmojiService(db, self.web_client)
-            emojis = emoji_service.extract_emojis_from_text(text)
-            mentioned_user_ids = emoji_service.extract_user_mentions(text, event)
             
-            logger.debug(f'Mentioned user IDs: {mentioned_user_ids}')
+            # If no tracked emojis found, nothing to track; checked first so
+            # mentions are never resolved for such messages
+            emoji_counts = emoji_service.count_emojis_in_text(text)
+            if not emoji_counts:
+                return None
             
-            # Ensure all mentioned users exist in the database
-            if mentioned_user_ids:
-                emoji_service.ensure_users_exist(mentioned_user_ids)
+            mentioned_user_ids = emoji_service.extract_user_mentions(text, event)
             
-            # If no emojis found, nothing to track
-            if not emojis:
-                return
+            logger.debug('Mentioned user IDs: %s', mentioned_user_ids)
             
             # Get sender information for feedback
-            sender_info = emoji_service.create_or_update_user(sender_user_id)
+            sender_name = emoji_service.get_user_display_name(sender_user_id) or sender_user_id
             
-            tracked_emojis = []
-            
-            # If there are mentioned users, track emojis for each sender->receiver pair
-            if mentioned_user_ids:
-                for mentioned_user_id in mentioned_user_ids:
-                    # Skip self-mentions
-                    if mentioned_user_id == sender_user_id:
-                        continue
-                    
-                    # Track each emoji for this sender->receiver pair
-                    for emoji in emojis:
-                        usage = emoji_service.track_emoji_usage(
-                            user_slack_id=sender_user_id,
-                            emoji_name=emoji,
-                            usage_type="message",
-                            channel_slack_id=channel,
-                            message_ts=ts,
-                            message_text=text,
-                            target_user_slack_id=mentioned_user_id,
-                        )
-                        if usage and emoji not in tracked_emojis:
-                            tracked_emojis.append(emoji)
-                    
-                    # Send ephemeral message to receiver
-                    if tracked_emojis:
-                        receiving_feedback_text = f"You have received a Bloom from {sender_info.display_name or sender_user_id}: \n\n {text}"
-                        await self.send_ephemeral_message(mentioned_user_id, receiving_feedback_text)
-                        logger.info(f"Sent bloom notification to {mentioned_user_id} from {sender_user_id}")
-            
-            else:
-                # No mentions - track as general message emojis (legacy behavior)
-                for emoji in emojis:
-                    usage = emoji_service.track_emoji_usage(
-                        user_slack_id=sender_user_id,
-                        emoji_name=emoji,
-                        usage_type="message",
-                        channel_slack_id=channel,
-                        message_ts=ts,
-                        message_text=text,
-                    )
-                    if usage:
-                        tracked_emojis.append(emoji)
+            # Track every emoji for each sender->receiver pair, skipping
+            # self-mentions; without mentions, track as general message emojis
+            receiver_ids = [
+                mentioned_user_id
+                for mentioned_user_id in mentioned_user_ids
+                if mentioned_user_id != sender_user_id
+            ]
+            if receiver_ids or not mentioned_user_ids:
+                tracked_emojis = emoji_service.track_message_emojis(
+                    user_slack_id=sender_user_id,
+                    emoji_counts=emoji_counts,
+                    channel_slack_id=channel,
+                    message_ts=ts,
+                    message_text=text,
+                    target_user_slack_ids=receiver_ids,
+                )
             
-            # Send ephemeral feedback to sender if emojis were tracked
             if tracked_emojis:
-                if mentioned_user_ids:
-                    sending_feedback_text = f"You have sent a Bloom to {len(mentioned_user_ids)} user(s): \n\n {text}"
-                else:
-                    sending_feedback_text = f"You have sent a Bloom: \n\n {text}"
-                await self.send_ephemeral_message(sender_user_id, sending_feedback_text)
-                logger.info(f"Processed bloom from {sender_user_id} with {len(tracked_emojis)} emojis to {len(mentioned_user_ids)} users")
+                notified_user_ids = receiver_ids
+        
+        return sender_name, mentioned_user_ids, notified_user_ids, tracked_emojis
 
     async def _handle_user_change(self, event: Dict[str, Any]) -> None:
         """Handle user_change events to update user information."""
@@ -294,7 +412,22 @@ class SlackService:
         if not user_id:
             return
         
+        # Renames change how @name mentions resolve
+        invalidate_user_lookup_cache()
+        self._remember_bot_user(user_id, user_data)
+        
         # Update user information
+        await asyncio.to_thread(self._update_user, user_id, user_data)
+
+    def _remember_bot_user(self, user_id: str, user_data: Dict[str, Any]) -> None:
+        """Track whether a user from users.list or user_change is a bot."""
+        if user_data.get("is_bot") and not user_data.get("deleted"):
+            self._bot_users.add(user_id)
+        else:
+            self._bot_users.discard(user_id)
+
+    def _update_user(self, user_id: str, user_data: Dict[str, Any]) -> None:
+        """Store updated user information (runs in a worker thread)."""
         with get_db_session() as db:
             emoji_service = EmojiService(db, self.web_client)
             profile = user_data.get("profile", {})
@@ -316,6 +449,10 @@ class SlackService:
             return
         
         # Update channel information
+        await asyncio.to_thread(self._update_channel, channel_id, channel_data)
+
+    def _update_channel(self, channel_id: str, channel_data: Dict[str, Any]) -> None:
+        """Store updated channel information (runs in a worker thread)."""
         with get_db_session() as db:
             emoji_service = EmojiService(db, self.web_client)
             
@@ -329,94 +466,115 @@ class SlackService:
     async def send_ephemeral_message(self, user: str, text: str) -> bool:
         """Send an ephemeral message to a specific user in a channel."""
         try:
-            response = self.web_client.chat_postEphemeral(
+            response = await self.async_web_client.chat_postEphemeral(
                 channel=user,
                 user=user,
                 text=text
             )
             return response.get("ok", False)
         except Exception as e:
-            logger.error(f"Error sending ephemeral message to {user}: {e}")
+            logger.error("Error sending ephemeral message to %s: %s", user, e)
             return False
 
     async def get_user_info(self, user_id: str) -> Optional[Dict[str, Any]]:
         """Get user information from Slack API."""
         try:
-            response = self.web_client.users_info(user=user_id)
+            response = await self.async_web_client.users_info(user=user_id)
             return response.get("user")
         except Exception as e:
-            logger.error(f"Error fetching user info for {user_id}: {e}")
+            logger.error("Error fetching user info for %s: %s", user_id, e)
             return None
 
     async def get_channel_info(self, channel_id: str) -> Optional[Dict[str, Any]]:
         """Get channel information from Slack API."""
         try:
-            response = self.web_client.conversations_info(channel=channel_id)
+            response = await self.async_web_client.conversations_info(channel=channel_id)
             return response.get("channel")
         except Exception as e:
-            logger.error(f"Error fetching channel info for {channel_id}: {e}")
+            logger.error("Error fetching channel info for %s: %s", channel_id, e)
             return None
 
     async def test_connection(self) -> bool:
         """Test the Slack connection."""
         try:
-            auth_response = self.web_client.auth_test()
-            logger.info(f"Slack connection test successful: {auth_response.get('user')}")
+            auth_response = await self.async_web_client.auth_test()
+            logger.info("Slack connection test successful: %s", auth_response.get('user'))
             return True
         except Exception as e:
-            logger.error(f"Slack connection test failed: {e}")
+            logger.error("Slack connection test failed: %s", e)
             return False
 
+    async def _iter_pages(
+        self, method: Callable[..., Awaitable[Any]], key: str, **kwargs: Any
+    ) -> AsyncIterator[List[Dict[str, Any]]]:
+        """Yield the pages of a cursored Slack list call until one is empty or last.
+
+        The request for the next page is started before the current page is
+        yielded, so Slack latency overlaps with the caller's work.
+        """
+        next_page: Optional[asyncio.Future] = asyncio.ensure_future(method(cursor=None, **kwargs))
+        try:
+            while next_page is not None:
+                response = await next_page
+                next_page = None
+                
+                items = response.get(key, [])
+                if not items:
+                    return
+                
+                cursor = response.get("response_metadata", {}).get("next_cursor")
+                if cursor:
+                    next_page = asyncio.ensure_future(method(cursor=cursor, **kwargs))
+                yield items
+        finally:
+            if next_page is not None:
+                next_page.cancel()
+
     async def sync_users(self, limit: int = 1000) -> int:
         """Sync users from Slack workspace to database."""
         logger.info("Starting user synchronization...")
         synced_count = 0
         
         try:
-            cursor = None
             with get_db_session() as db:
                 emoji_service = EmojiService(db, self.web_client)
                 
-                while True:
-                    # Get users from Slack API
-                    users_response = self.web_client.users_list(
-                        limit=min(limit, 200),  # Slack API limit
-                        cursor=cursor,
-                    )
-                    
-                    users = users_response.get("members", [])
-                    if not users:
-                        break
-                    
-                    # Process each user
-                    for user_data in users:
-                        if user_data.get("deleted"):
-                            continue
+                # The next page is fetched while this one is written
+                pages = self._iter_pages(
+                    self.async_web_client.users_list,
+                    "members",
+                    limit=min(limit, 200),  # Slack API limit
+                )
+                async with aclosing(pages):
+                    async for users in pages:
+                        # Upsert the whole page in one statement
+                        user_rows = [
+                            {
+                                "slack_id": user_data["id"],
+                                "email": user_data.get("profile", {}).get("email"),
+                                "display_name": user_data.get("profile", {}).get("display_name")
+                                or user_data.get("name"),
+                                "real_name": user_data.get("profile", {}).get("real_name"),
+                                "is_bot": user_data.get("is_bot", False),
+                            }
+                            for user_data in users
+                            if not user_data.get("deleted")
+                        ]
+                        for user_data in users:
+                            self._remember_bot_user(user_data["id"], user_data)
+                        await asyncio.to_thread(emoji_service.bulk_upsert_users, user_rows)
+                        synced_count += len(user_rows)
                         
-                        profile = user_data.get("profile", {})
-                        emoji_service.create_or_update_user(
-                            slack_id=user_data["id"],
-                            email=profile.get("email"),
-                            display_name=profile.get("display_name") or user_data.get("name"),
-                            real_name=profile.get("real_name"),
-                            is_bot=user_data.get("is_bot", False),
-                        )
-                        synced_count += 1
-                    
-                    # Check if there are more users
-                    cursor = users_response.get("response_metadata", {}).get("next_cursor")
-                    if not cursor:
-                        break
-                    
-                    # Check limit
-                    if synced_count >= limit:
-                        break
+                        # Check limit
+                        if synced_count >= limit:
+                            break
             
-            logger.info(f"User synchronization completed: {synced_count} users synced")
+            invalidate_user_lookup_cache()
+            logger.info("User synchronization completed: %s users synced", synced_count)
             return synced_count
             
         except Exception as e:
-            logger.error(f"Error during user synchronization: {e}")
+            logger.error("Error during user synchronization: %s", e)
             raise
 
     async def sync_channels(self, limit: int = 1000) -> int:
@@ -425,44 +583,38 @@ class SlackService:
         synced_count = 0
         
         try:
-            cursor = None
             with get_db_session() as db:
                 emoji_service = EmojiService(db, self.web_client)
                 
-                while True:
-                    # Get channels from Slack API
-                    channels_response = self.web_client.conversations_list(
-                        limit=min(limit, 200),  # Slack API limit
-                        cursor=cursor,
-                        types="public_channel,private_channel",
-                    )
-                    
-                    channels = channels_response.get("channels", [])
-                    if not channels:
-                        break
-                    
-                    # Process each channel
-                    for channel_data in channels:
-                        emoji_service.create_or_update_channel(
-                            slack_id=channel_data["id"],
-                            name=channel_data.get("name"),
-                            is_private=channel_data.get("is_private", False),
-                            is_archived=channel_data.get("is_archived", False),
-                        )
-                        synced_count += 1
-                    
-                    # Check if there are more channels
-                    cursor = channels_response.get("response_metadata", {}).get("next_cursor")
-                    if not cursor:
-                        break
-                    
-                    # Check limit
-                    if synced_count >= limit:
-                        break
+                # The next page is fetched while this one is written
+                pages = self._iter_pages(
+                    self.async_web_client.conversations_list,
+                    "channels",
+                    limit=min(limit, 200),  # Slack API limit
+                    types="public_channel,private_channel",
+                )
+                async with aclosing(pages):
+                    async for channels in pages:
+                        # Upsert the whole page in one statement
+                        channel_rows = [
+                            {
+                                "slack_id": channel_data["id"],
+                                "name": channel_data.get("name"),
+                                "is_private": channel_data.get("is_private", False),
+                                "is_archived": channel_data.get("is_archived", False),
+                            }
+                            for channel_data in channels
+                        ]
+                        await asyncio.to_thread(emoji_service.bulk_upsert_channels, channel_rows)
+                        synced_count += len(channel_rows)
+                        
+                        # Check limit
+                        if synced_count >= limit:
+                            break
             
-            logger.info(f"Channel synchronization completed: {synced_count} channels synced")
+            logger.info("Channel synchronization completed: %s channels synced", synced_count)
             return synced_count
             
         except Exception as e:
-            logger.error(f"Error during channel synchronization: {e}")
+            logger.error("Error during channel synchronization: %s", e)
             raise
\ No newline at end of file
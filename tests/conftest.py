@@ -0,0 +1,127 @@
+"""Shared fixtures: a seeded in-memory SQLite database and a known emoji configuration."""
+
+import pytest
+from sqlalchemy import create_engine, event
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import StaticPool
+from sqlalchemy.sql.functions import now
+
+from create_sample_data import seed_sample_data
+from slack_emoji_tracker import service
+from slack_emoji_tracker.config import config
+from slack_emoji_tracker.models import Base
+from slack_emoji_tracker.service import EmojiService
+
+TEST_EMOJI_CONFIG = {
+    "emojis": {
+        "trophy": {"score": 3, "description": "Big win"},
+        "nope": {"score": 0, "description": "Never tracked"},
+        "thumbsdown": {"score": -1, "description": "Counts against"},
+    },
+    "settings": {
+        "default_score": 1,
+        "track_all_emojis": True,
+        "case_sensitive": False,
+    },
+}
+
+
+@compiles(now, "sqlite")
+def _sqlite_now(element, compiler, **kw):
+    """Stamp rows in the text format SQLAlchemy binds datetimes with on SQLite.
+
+    SQLite keeps timestamps as text and CURRENT_TIMESTAMP has no fraction, so
+    database-stamped rows would not compare correctly against bound
+    datetimes such as the history cursor. PostgreSQL compares real
+    timestamps and needs nothing like this.
+    """
+    return "strftime('%Y-%m-%d %H:%M:%f000', 'now')"
+
+
+@pytest.fixture(scope="session", autouse=True)
+def emoji_config():
+    """Score trophy at 3, thumbsdown at -1, skip nope and track every other emoji at 1."""
+    original = config.emoji_config
+    config.emoji_config = TEST_EMOJI_CONFIG
+    config._build_emoji_lookups()
+    yield config
+    config.emoji_config = original
+    config._build_emoji_lookups()
+
+
+@pytest.fixture(autouse=True)
+def clear_process_caches():
+    """Drop process-wide caches so keys from one test database never leak into the next."""
+    yield
+    for cache in (
+        service._leaderboard_cache,
+        service._leaderboard_stale,
+        service._refreshed_users,
+        service._failed_user_fetches,
+        service._user_pks,
+        service._channel_pks,
+        service._user_lookup_cache,
+        service._unresolved_mentions,
+    ):
+        cache.clear()
+
+
+@pytest.fixture(scope="session")
+def engine(emoji_config):
+    """An in-memory SQLite database, created and seeded with the sample data once."""
+    engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    
+    @event.listens_for(engine, "connect")
+    def _connect(dbapi_connection, connection_record):
+        # Let SQLAlchemy emit BEGIN itself so SAVEPOINTs work with pysqlite
+        dbapi_connection.isolation_level = None
+        dbapi_connection.execute("PRAGMA foreign_keys=ON")
+    
+    @event.listens_for(engine, "begin")
+    def _begin(connection):
+        connection.exec_driver_sql("BEGIN")
+    
+    Base.metadata.create_all(engine)
+    with Session(engine) as session:
+        seed_sample_data(session)
+        session.commit()
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def db(engine):
+    """A session on the seeded database whose changes are rolled back after the test.
+
+    Commits inside the test release a SAVEPOINT instead of ending the outer
+    transaction, so every test starts from the same sample data.
+    """
+    connection = engine.connect()
+    transaction = connection.begin()
+    session = Session(
+        bind=connection,
+        autoflush=False,
+        expire_on_commit=False,
+        join_transaction_mode="create_savepoint",
+    )
+    yield session
+    session.close()
+    transaction.rollback()
+    connection.close()
+
+
+@pytest.fixture
+def emoji_service(db):
+    """An EmojiService without a Slack client."""
+    return EmojiService(db)
+
+
+@pytest.fixture
+def sample_data(db):
+    """The session, for tests that read the create_sample_data users, channels and usage."""
+    return db
@@ -0,0 +1,65 @@
+"""Tests for user history pagination."""
+
+from datetime import datetime
+
+from sqlalchemy import update
+
+from slack_emoji_tracker.models import EmojiUsage
+
+ALICE = "U1234567890"
+NEW_USER = "UNEW1"
+
+
+def _walk_history(emoji_service, slack_id, limit, max_pages=20):
+    """Follow next_cursor from the first page to the last, returning every entry."""
+    page = emoji_service.get_user_history(slack_id, limit=limit)
+    entries = list(page["history"])
+    for _ in range(max_pages):
+        cursor = page["pagination"]["next_cursor"]
+        if cursor is None:
+            return entries
+        page = emoji_service.get_user_history(slack_id, limit=limit, cursor=cursor)
+        assert page["pagination"]["next_cursor"] != cursor, "cursor did not advance"
+        entries.extend(page["history"])
+    raise AssertionError("history pagination did not terminate")
+
+
+def test_cursor_walks_rows_stamped_in_the_same_second(db, emoji_service):
+    for emoji in ["fire", "heart", "rocket", "trophy", "clap"]:
+        emoji_service.track_emoji_usage(NEW_USER, emoji, "reaction")
+    db.execute(
+        update(EmojiUsage)
+        .where(EmojiUsage.user_id == emoji_service._get_user_id(NEW_USER))
+        .values(created_at=datetime(2024, 1, 1, 12, 0, 0))
+    )
+    db.commit()
+    
+    entries = _walk_history(emoji_service, NEW_USER, limit=2)
+    
+    # Newest first; ties on created_at fall back to the insertion order
+    assert [entry["emoji"] for entry in entries] == [
+        "clap",
+        "trophy",
+        "rocket",
+        "heart",
+        "fire",
+    ]
+
+
+def test_cursor_walk_matches_offset_listing(sample_data, emoji_service):
+    everything = emoji_service.get_user_history(ALICE, limit=100)
+    
+    assert _walk_history(emoji_service, ALICE, limit=3) == everything["history"]
+    assert everything["pagination"]["total"] == len(everything["history"])
+
+
+def test_later_pages_skip_the_count_unless_asked(sample_data, emoji_service):
+    first = emoji_service.get_user_history(ALICE, limit=2)
+    cursor = first["pagination"]["next_cursor"]
+    
+    later = emoji_service.get_user_history(ALICE, limit=2, cursor=cursor)
+    counted = emoji_service.get_user_history(ALICE, limit=2, cursor=cursor, include_total=True)
+    
+    assert first["pagination"]["total"] == 5
+    assert later["pagination"]["total"] is None
+    assert counted["pagination"]["total"] == 5
@@ -0,0 +1,336 @@
+"""Tests for the EmojiService write paths and the summary tables they maintain."""
+
+from sqlalchemy import func, select
+
+from create_sample_data import seed_sample_data
+from slack_emoji_tracker import service
+from slack_emoji_tracker.models import (
+    ChannelEmojiStats,
+    ChannelUserStats,
+    EmojiStats,
+    EmojiUsage,
+    User,
+)
+
+ALICE = "U1234567890"
+BOB = "U1234567891"
+GENERAL = "C1234567890"
+
+# Not part of the sample data, so tests can assert on their rows exactly
+NEW_SENDER = "UNEW1"
+NEW_TARGET = "UNEW2"
+NEW_CHANNEL = "CNEW"
+
+
+def _stats_snapshot(db):
+    """Everything the write path maintains incrementally, in a comparable form."""
+    return {
+        "emoji_stats": sorted(
+            db.execute(
+                select(
+                    EmojiStats.user_id,
+                    EmojiStats.emoji_name,
+                    EmojiStats.given_count,
+                    EmojiStats.given_score,
+                    EmojiStats.received_count,
+                    EmojiStats.received_score,
+                )
+            ).all()
+        ),
+        "user_totals": sorted(
+            db.execute(
+                select(
+                    User.id,
+                    User.total_given_count,
+                    User.total_given_score,
+                    User.total_received_count,
+                    User.total_received_score,
+                )
+            ).all()
+        ),
+        "channel_emojis": sorted(
+            db.execute(
+                select(
+                    ChannelEmojiStats.channel_id,
+                    ChannelEmojiStats.emoji_name,
+                    ChannelEmojiStats.count,
+                    ChannelEmojiStats.score,
+                )
+            ).all()
+        ),
+        "channel_users": sorted(
+            db.execute(
+                select(
+                    ChannelUserStats.channel_id,
+                    ChannelUserStats.user_id,
+                    ChannelUserStats.count,
+                    ChannelUserStats.score,
+                )
+            ).all()
+        ),
+    }
+
+
+def test_sample_data_rolls_up_into_user_stats(sample_data, emoji_service):
+    stats = emoji_service.get_user_stats(ALICE)
+    
+    assert stats["totals"] == {
+        "given_count": 5,
+        "given_score": 7,  # four emojis at 1 and a trophy at 3
+        "received_count": 4,
+        "received_score": 6,
+    }
+    assert stats["top_given"][0] == {"emoji": "trophy", "count": 1, "score": 3}
+
+
+def test_top_lists_keep_the_ten_highest_scores(db, emoji_service):
+    emoji_counts = {f"emoji{i}": i for i in range(1, 13)}
+    emoji_service.track_message_emojis(
+        NEW_SENDER, emoji_counts, GENERAL, "1.0", "text", [NEW_TARGET]
+    )
+    db.commit()
+    
+    stats = emoji_service.get_user_stats(NEW_SENDER)
+    
+    assert [entry["score"] for entry in stats["top_given"]] == list(range(12, 2, -1))
+    assert stats["top_received"] == []
+    assert stats["totals"]["given_count"] == sum(emoji_counts.values())
+    received = emoji_service.get_user_stats(NEW_TARGET)["top_received"]
+    assert [entry["emoji"] for entry in received] == [f"emoji{i}" for i in range(12, 2, -1)]
+
+
+def test_repeated_usage_upserts_one_stats_row(db, emoji_service):
+    for _ in range(3):
+        assert emoji_service.track_emoji_usage(
+            NEW_SENDER, "trophy", "reaction", GENERAL, target_user_slack_id=NEW_TARGET
+        )
+    db.commit()
+    
+    sender_id, target_id = emoji_service._get_user_ids([NEW_SENDER, NEW_TARGET]).values()
+    rows = db.execute(
+        select(
+            EmojiStats.user_id,
+            EmojiStats.given_count,
+            EmojiStats.received_count,
+            EmojiStats.received_score,
+        )
+        .where(EmojiStats.user_id.in_([sender_id, target_id]))
+        .order_by(EmojiStats.user_id)
+    ).all()
+    assert rows == [(sender_id, 3, 0, 0), (target_id, 0, 3, 9)]
+
+
+def test_untracked_emoji_is_not_stored(db, emoji_service):
+    usage_before = db.scalar(select(func.count(EmojiUsage.id)))
+    
+    assert emoji_service.track_emoji_usage(NEW_SENDER, "nope", "reaction", GENERAL) is False
+    assert db.scalar(select(func.count(EmojiUsage.id))) == usage_before
+    assert db.scalar(select(User.id).where(User.slack_id == NEW_SENDER)) is None
+
+
+def test_message_counts_multiply_score(db, emoji_service):
+    tracked = emoji_service.track_message_emojis(
+        NEW_SENDER, {"trophy": 2, "fire": 3, "nope": 5}, GENERAL, "1.0", "text", [NEW_TARGET]
+    )
+    db.commit()
+    
+    assert sorted(tracked) == ["fire", "trophy"]
+    assert emoji_service.get_user_stats(NEW_TARGET)["totals"] == {
+        "given_count": 0,
+        "given_score": 0,
+        "received_count": 5,
+        "received_score": 9,
+    }
+
+
+def test_negative_score_reactions_are_tracked(db, emoji_service, emoji_config):
+    # The reaction_added pre-filter checks should_track_emoji before the write path
+    assert emoji_config.should_track_emoji("thumbsdown")
+    assert emoji_service.track_emoji_usage(
+        NEW_SENDER, "thumbsdown", "reaction", GENERAL, target_user_slack_id=NEW_TARGET
+    )
+    db.commit()
+    
+    assert emoji_service.get_user_stats(NEW_TARGET)["totals"] == {
+        "given_count": 0,
+        "given_score": 0,
+        "received_count": 1,
+        "received_score": -1,
+    }
+
+
+def test_negative_score_message_emojis_are_tracked(db, emoji_service):
+    emoji_counts = emoji_service.count_emojis_in_text(":thumbsdown: :nope: :fire: :thumbsdown:")
+    assert emoji_counts == {"thumbsdown": 2, "fire": 1}
+    
+    emoji_service.track_message_emojis(
+        NEW_SENDER, emoji_counts, GENERAL, "1.0", "text", [NEW_TARGET]
+    )
+    db.commit()
+    
+    assert emoji_service.get_user_stats(NEW_TARGET)["totals"] == {
+        "given_count": 0,
+        "given_score": 0,
+        "received_count": 3,
+        "received_score": -1,
+    }
+
+
+def test_user_totals_match_emoji_stats(sample_data, emoji_service):
+    emoji_service.track_message_emojis(ALICE, {"fire": 4}, GENERAL, "2.0", "text", [BOB])
+    sample_data.commit()
+    
+    sums = {
+        row.user_id: tuple(row[1:])
+        for row in sample_data.execute(
+            select(
+                EmojiStats.user_id,
+                func.sum(EmojiStats.given_count),
+                func.sum(EmojiStats.given_score),
+                func.sum(EmojiStats.received_count),
+                func.sum(EmojiStats.received_score),
+            ).group_by(EmojiStats.user_id)
+        )
+    }
+    for user in sample_data.execute(select(User)).scalars():
+        assert sums.get(user.id, (0, 0, 0, 0)) == (
+            user.total_given_count,
+            user.total_given_score,
+            user.total_received_count,
+            user.total_received_score,
+        )
+
+
+def test_rebuild_matches_incremental_stats(sample_data, emoji_service):
+    emoji_service.track_message_emojis(ALICE, {"trophy": 2}, GENERAL, "3.0", "text", [BOB])
+    sample_data.commit()
+    incremental = _stats_snapshot(sample_data)
+    
+    emoji_service.rebuild_emoji_stats()
+    sample_data.commit()
+    
+    assert _stats_snapshot(sample_data) == incremental
+
+
+def test_channel_stats_match_usage_log(sample_data, emoji_service):
+    stats = emoji_service.get_channel_stats(GENERAL)
+    
+    channel_id = emoji_service._get_channel_id(GENERAL)
+    count, score = sample_data.execute(
+        select(func.sum(EmojiUsage.count), func.sum(EmojiUsage.emoji_score)).where(
+            EmojiUsage.channel_id == channel_id
+        )
+    ).one()
+    assert stats["totals"] == {"total_count": count, "total_score": score}
+    assert stats["top_emojis"][0]["emoji"] == "trophy"
+    assert [user["score"] for user in stats["top_users"]] == sorted(
+        (user["score"] for user in stats["top_users"]), reverse=True
+    )
+
+
+def test_stats_upserts_split_into_batches(monkeypatch, sample_data, emoji_service):
+    monkeypatch.setattr(service, "STATS_UPSERT_BATCH_SIZE", 2)
+    tracked = emoji_service.track_emoji_usage_bulk(
+        [
+            {
+                "user_slack_id": sender,
+                "emoji_name": emoji,
+                "usage_type": "reaction",
+                "channel_slack_id": channel,
+                "target_user_slack_id": target,
+            }
+            for sender, target in [(ALICE, BOB), (BOB, ALICE), (NEW_SENDER, NEW_TARGET)]
+            for emoji in ["fire", "heart", "trophy"]
+            for channel in [GENERAL, NEW_CHANNEL]
+        ]
+    )
+    sample_data.commit()
+    batched = _stats_snapshot(sample_data)
+    
+    emoji_service.rebuild_emoji_stats()
+    sample_data.commit()
+    
+    assert tracked == 18
+    assert _stats_snapshot(sample_data) == batched
+
+
+def test_bulk_tracking_creates_unknown_users_and_channels(db, emoji_service):
+    users_before = db.scalar(select(func.count(User.id)))
+    
+    tracked = emoji_service.track_emoji_usage_bulk(
+        [
+            {
+                "user_slack_id": NEW_SENDER,
+                "emoji_name": "fire",
+                "usage_type": "reaction",
+                "channel_slack_id": NEW_CHANNEL,
+                "target_user_slack_id": NEW_TARGET,
+            },
+            {"user_slack_id": NEW_SENDER, "emoji_name": "nope", "usage_type": "reaction"},
+            {
+                "user_slack_id": NEW_TARGET,
+                "emoji_name": "trophy",
+                "usage_type": "reaction",
+                "channel_slack_id": NEW_CHANNEL,
+            },
+        ]
+    )
+    db.commit()
+    
+    assert tracked == 2
+    assert db.scalar(select(func.count(User.id))) == users_before + 2
+    assert emoji_service.get_channel_stats(NEW_CHANNEL)["totals"] == {
+        "total_count": 2,
+        "total_score": 4,
+    }
+    assert emoji_service.get_user_stats(NEW_TARGET)["totals"]["received_count"] == 1
+
+
+def test_leaderboard_orders_by_total(sample_data, emoji_service):
+    leaderboard = emoji_service.get_leaderboard(sort_by="given_score", limit=3)
+    
+    scores = [entry["stats"]["given_score"] for entry in leaderboard]
+    assert scores == sorted(scores, reverse=True)
+    assert [entry["rank"] for entry in leaderboard] == [1, 2, 3]
+
+
+def test_bulk_upsert_keeps_profile_fields_slack_left_out(db, emoji_service):
+    emoji_service.bulk_upsert_users(
+        [
+            {
+                "slack_id": NEW_SENDER,
+                "email": "new@example.com",
+                "display_name": "New User",
+                "real_name": "New Person",
+                "is_bot": False,
+            }
+        ]
+    )
+    emoji_service.bulk_upsert_users(
+        [
+            {
+                "slack_id": NEW_SENDER,
+                "email": None,
+                "display_name": "new.user",
+                "real_name": None,
+                "is_bot": False,
+            }
+        ]
+    )
+    emoji_service.bulk_upsert_channels(
+        [{"slack_id": NEW_CHANNEL, "name": "new-channel", "is_private": False}]
+    )
+    emoji_service.bulk_upsert_channels([{"slack_id": NEW_CHANNEL, "name": None, "is_private": True}])
+    db.commit()
+    
+    user = db.execute(select(User).where(User.slack_id == NEW_SENDER)).scalar_one()
+    assert (user.email, user.display_name, user.real_name) == (
+        "new@example.com",
+        "new.user",
+        "New Person",
+    )
+    assert emoji_service.get_channel_stats(NEW_CHANNEL)["channel"] == {
+        "slack_id": NEW_CHANNEL,
+        "name": "new-channel",
+        "is_private": True,
+    }